@@ -26,6 +26,10 @@ class AlarmsAndEvents:
     def __init__(self, page: Page):
         self.page = page
 
+        # Last table scans as (time.monotonic() timestamp, rows) - reused when callers pass max_age_ms
+        self._events_cache: tuple[float, list[dict]] | None = None
+        self._alarms_cache: tuple[float, list[dict]] | None = None
+
     # ==========================================================
     # Internal small helpers 
     # ==========================================================
@@ -1282,6 +1286,8 @@ class AlarmsAndEvents:
         """
         Acknowledge an alarm based on the desired alarm row index.
         """
+        self._alarms_cache = None  # table content is about to change
+
         try:
             if row_index < 0:
                 raise AssertionError(f"row_index must be >= 0. Got {row_index}")
@@ -1450,6 +1456,8 @@ class AlarmsAndEvents:
         3) Click "Clear Alert".
         4) Verify the Severity cell text becomes 'Clear' for that row index.
         """
+        self._alarms_cache = None  # table content is about to change
+
         try:
             table = self.page.locator("app-simple-table div.simple-table-container table").first
             expect(table).to_be_visible(timeout=timeout)
@@ -1606,6 +1614,8 @@ class AlarmsAndEvents:
         Return:
             True if the event was hidden successfully.
         """
+        self._events_cache = None  # table content is about to change
+
         try:
             if row_index < 0:
                 raise ValueError("row_index must be >= 0")
@@ -1829,6 +1839,8 @@ class AlarmsAndEvents:
         Return:
             True if checkbox reached the requested state.
         """
+        self._events_cache = None  # table content is about to change
+
         try:
             checkbox = self.page.locator("app-checkbox", has_text=re.compile(r"^\s*Show hidden events\s*$", re.IGNORECASE)).first
 
@@ -1884,11 +1896,16 @@ class AlarmsAndEvents:
         return int(last_page_text)
 
     # ✅
-    def get_all_events(self, timeout: int = 15000, max_pages: int = 15000, delay: int | None = None) -> list[dict]:
+    def get_all_events(self, timeout: int = 15000, max_pages: int = 15000, delay: int | None = None, max_age_ms: int = 0) -> list[dict]:
         """
         Return all rows currently displayed in the Alarms/Events table across pagination.
         Output: list of dicts keyed by the visible column headers.
+
+        max_age_ms > 0 -> return the previous scan without touching the DOM if it is younger than max_age_ms.
         """
+        if max_age_ms and self._events_cache and (time.monotonic() - self._events_cache[0]) * 1000 < max_age_ms:
+            return [dict(r) for r in self._events_cache[1]]  # copies - callers may mutate the result
+
         try:
             self.set_faults_type("Events")
             table = self.page.locator("div.faults-actionWrapper-table app-simple-table table").first
@@ -1904,57 +1921,49 @@ class AlarmsAndEvents:
             # ----------------------------
             # Column headers + column types
             # ----------------------------
-            ths = thead.locator("th")
-            th_count = ths.count()
-            if th_count == 0:
+            # Read all header cells in a single round-trip (instead of count()+inner_text() per column)
+            headers: list[str]
+            col_kinds: list[str]  # "text" | "checkbox" | "ignore"
+            headers, col_kinds = thead.evaluate(
+                """thead => {
+                    const out = [[], []];
+                    for (const th of thead.querySelectorAll('th')) {
+                        const cls = th.getAttribute('class') || '';
+
+                        // Ignore non-data columns (expand/edit icons)
+                        if (cls.includes('expand') || cls.includes('edit')) {
+                            out[0].push(''); out[1].push('ignore');
+                            continue;
+                        }
+
+                        const s = th.querySelector('span.name');
+                        const t = (s ? s.textContent : '').replace(/\\s+/g, ' ').trim();
+
+                        // Service affecting column is a checkbox in tbody, not text
+                        if (t.toLowerCase() === 'service affecting') {
+                            out[0].push(t || 'Service affecting'); out[1].push('checkbox');
+                        } else {
+                            out[0].push(t); out[1].push('text');
+                        }
+                    }
+                    return out;
+                }"""
+            )
+            if not headers:
                 return []
 
-            headers: list[str] = []
-            col_kinds: list[str] = []  # "text" | "checkbox" | "ignore"
-
-            for i in range(th_count):
-                th = ths.nth(i)
-                cls = (th.get_attribute("class") or "").strip()
-
-                # Ignore non-data columns (expand/edit icons)
-                if "expand" in cls or "edit" in cls:
-                    headers.append("")
-                    col_kinds.append("ignore")
-                    continue
-
-                name_span = th.locator("span.name").first
-                header_txt = self._clean(name_span.inner_text()) if name_span.count() else ""
-
-                # Service affecting column is a checkbox in tbody, not text
-                if header_txt.lower() == "service affecting":
-                    headers.append(header_txt or "Service affecting")
-                    col_kinds.append("checkbox")
-                else:
-                    headers.append(header_txt)
-                    col_kinds.append("text")
-
             # Remove completely empty header slots 
-            def parse_row(tr) -> dict:
-                tds = tr.locator("td")
+            def parse_row(cells: list) -> dict:
                 d: dict = {}
-                td_count = tds.count()
 
-                for i in range(min(td_count, len(headers))):
+                for i, value in enumerate(cells):
                     if col_kinds[i] == "ignore":
                         continue
                     key = headers[i]
                     if not key:
                         continue
 
-                    td = tds.nth(i)
-
-                    if col_kinds[i] == "checkbox":
-                        unchecked = td.locator("svg.unchecked")
-                        d[key] = (unchecked.count() == 0)
-                    else:
-                        span = td.locator("span.name").first
-                        txt = span.inner_text() if span.count() else td.inner_text()
-                        d[key] = self._clean(txt)
+                    d[key] = value
 
                 return d
 
@@ -1966,27 +1975,38 @@ class AlarmsAndEvents:
                     return ""
 
             def read_current_page_rows() -> list[dict]:
-                # Wait until there is at least 1 row OR table is stable (some pages can be empty)
-                self.wait_until(lambda: tbody.locator("tr").count() >= 0, timeout_ms=timeout, interval_ms=200)
-                rows = tbody.locator("tr")
-                out: list[dict] = []
-                for r in range(rows.count()):
-                    out.append(parse_row(rows.nth(r)))
-                return out
+                # Extract every cell of the page in one round-trip, already whitespace-normalized.
+                # textContent (unlike innerText) does not force a layout per cell.
+                rows = tbody.evaluate(
+                    """(tbody, kinds) => Array.from(tbody.querySelectorAll('tr'), tr =>
+                        Array.from(tr.querySelectorAll('td')).slice(0, kinds.length).map((td, i) => {
+                            if (kinds[i] === 'ignore') return null;
+                            if (kinds[i] === 'checkbox') return !td.querySelector('svg.unchecked');
+                            const span = td.querySelector('span.name');
+                            return (span || td).textContent.replace(/\\s+/g, ' ').trim();
+                        })
+                    )""",
+                    col_kinds,
+                )
+                return [parse_row(cells) for cells in rows]
 
             next_btn = self.page.locator("button", has_text=re.compile(r"^\s*Next\s*$", re.IGNORECASE)).first
             if next_btn.count() == 0:
                 next_btn = self.page.locator("a", has_text=re.compile(r"^\s*Next\s*$", re.IGNORECASE)).first
 
             all_rows: list[dict] = []
-            seen = set()
+            seen: dict[str, list[dict]] = {}  # cheap key -> distinct rows already collected under it
 
             def add_unique(rows: list[dict]):
                 for row in rows:
-                    # build a stable key (tuple of sorted items)
-                    key = tuple(sorted(row.items()))
-                    if key not in seen:
-                        seen.add(key)
+                    # Pre-filter on a cheap key; only rows sharing it are compared in full (dict equality)
+                    fast = f"{row.get('Message', '')}|{row.get('Detection Timestamp', '')}"
+                    bucket = seen.get(fast)
+                    if bucket is None:
+                        seen[fast] = [row]
+                        all_rows.append(row)
+                    elif row not in bucket:
+                        bucket.append(row)
                         all_rows.append(row)
 
             # Page 1
@@ -1994,6 +2014,7 @@ class AlarmsAndEvents:
 
             # If no paginator -> return current page only
             if next_btn.count() == 0:
+                self._events_cache = (time.monotonic(), [dict(r) for r in all_rows])
                 return all_rows
 
             # Iterate pages
@@ -2020,18 +2041,22 @@ class AlarmsAndEvents:
                 
                 add_unique(read_current_page_rows())
 
+            self._events_cache = (time.monotonic(), [dict(r) for r in all_rows])
             return all_rows
 
         except Exception as e:
             raise AssertionError(f"get_all_events failed. Problem: {e}")
 
     # ✅
-    def get_all_alarms(self, timeout: int = 12000, verbose: bool = False, max_pages: int | None = None) -> list[dict]:
+    def get_all_alarms(self, timeout: int = 12000, verbose: bool = False, max_pages: int | None = None, max_age_ms: int = 0) -> list[dict]:
         """
         Return all alarms currently shown in the Alarms table, across ALL pages.
 
         verbose=True -> prints number of pages being iterated.
+        max_age_ms > 0 -> return the previous scan without touching the DOM if it is younger than max_age_ms.
         """
+        if max_age_ms and self._alarms_cache and (time.monotonic() - self._alarms_cache[0]) * 1000 < max_age_ms:
+            return [dict(r) for r in self._alarms_cache[1]]  # copies - callers may mutate the result
 
         try:
             def table_locator():
@@ -2073,69 +2098,52 @@ class AlarmsAndEvents:
                 sleep(0.5)
                 return locator
 
-            def service_affecting_value(row) -> bool:
-                """
-                Service affecting is TRUE when the checkbox label has class 'checked'
-                OR svg has class 'checked', in the Service Affecting column (td index 9).
-                """
-                try:
-                    tds = row.locator("td")
-                    if tds.count() <= 9:
-                        return False
-
-                    td = tds.nth(9)
-
-                    label = td.locator("app-checkbox label.checkbox-container").first
-                    if label.count() == 0:
-                        return False
-
-                    cls = (label.get_attribute("class") or "").lower().split()
-                    if "checked" in cls:
-                        return True
-
-                    # Fallback: check svg class (per your HTML)
-                    svg = td.locator("svg").first
-                    if svg.count() > 0:
-                        svg_cls = (svg.get_attribute("class") or "").lower().split()
-                        return "checked" in svg_cls
-
-                    return False
-
-                except Exception:
-                    return False
-
-            def parse_row(row) -> dict:
-                tds = row.locator("td")
-                sleep(0.5)
+            def read_page_rows(rows) -> list[dict]:
+                # Extract every row of the page in one round-trip (no per-row/per-cell handles to leak or go stale).
+                # Service affecting (td index 9) is TRUE when the checkbox label has class 'checked'
+                # OR (fallback, per your HTML) its svg has class 'checked'.
+                cells = rows.evaluate_all(
+                    """trs => trs.map(tr => {
+                        const tds = tr.querySelectorAll('td');
+                        const hasChecked = el => !!el && Array.from(el.classList).some(c => c.toLowerCase() === 'checked');
+                        const texts = Array.from(tds, td => (td.innerText || '').trim());
+                        let sa = false;
+                        const label = tds[9] ? tds[9].querySelector('app-checkbox label.checkbox-container') : null;
+                        if (label) sa = hasChecked(label) || hasChecked(tds[9].querySelector('svg'));
+                        return {texts, sa};
+                    })"""
+                )
 
-                def td_text(i: int) -> str:
-                    if tds.count() <= i:
-                        return ""
-                    return (tds.nth(i).inner_text() or "").strip()
-
-                return {
-                    "message": td_text(1),
-                    "severity": td_text(2),
-                    "managed_device": td_text(3),
-                    "domain": td_text(4),
-                    "category": td_text(5),
-                    "source": td_text(6),
-                    "detection_timestamp": td_text(7),
-                    "creation_timestamp": td_text(8),
-                    "service_affecting": service_affecting_value(row),
-                    "device_type": td_text(10),
-                }
+                def parse_row(texts: list[str], service_affecting: bool) -> dict:
+                    def td_text(i: int) -> str:
+                        return texts[i] if len(texts) > i else ""
+
+                    return {
+                        "message": td_text(1),
+                        "severity": td_text(2),
+                        "managed_device": td_text(3),
+                        "domain": td_text(4),
+                        "category": td_text(5),
+                        "source": td_text(6),
+                        "detection_timestamp": td_text(7),
+                        "creation_timestamp": td_text(8),
+                        "service_affecting": service_affecting,
+                        "device_type": td_text(10),
+                    }
+
+                return [parse_row(c["texts"], c["sa"]) for c in cells]
 
             def page_signature() -> str:
-                rows = get_rows()
-                if rows.count() == 0:
-                    return "EMPTY"
-                first = rows.nth(0)
-                msg = first.locator("td").nth(0).inner_text()
-                sleep(0.5)
-                det = first.locator("td").nth(6).inner_text()
-                sleep(0.5)
-                return f"{msg}||{det}"
+                table = table_locator()
+                expect(table).to_be_visible(timeout=timeout)
+                return table.evaluate(
+                    """table => {
+                        const tr = table.querySelector('tbody tr');
+                        if (!tr) return 'EMPTY';
+                        const tds = tr.querySelectorAll('td');
+                        return `${tds[0] ? tds[0].textContent : ''}||${tds[6] ? tds[6].textContent : ''}`;
+                    }"""
+                )
 
             # --------------------------------------------------
             # Detect total pages
@@ -2161,13 +2169,24 @@ class AlarmsAndEvents:
             # Ensure we start from page 1
             # --------------------------------------------------
             if pag.count() > 0:
-                prev = prev_btn_locator()
-                if prev.count() > 0:
-                    for _ in range(10):
-                        if is_disabled(prev):
-                            break
-                        prev.click(force=True)
-                        self.wait_until(lambda: True, timeout_ms=200)
+                # Jump straight to page 1 ('First' link, else the '1' page link) - one render instead of up to 10
+                first_page = pag.locator("a.page-link[aria-label='First']").first
+                if first_page.count() == 0:
+                    first_page = pag.locator("li.page-item:not(.disabled) a.page-link", has_text=re.compile(r"^\s*1\s*$")).first
+
+                if first_page.count() > 0:
+                    first_page.click(force=True)
+                    active_page = pag.locator("li.page-item.active a.page-link").first
+                    expect(active_page).to_have_text(re.compile(r"^\s*1\b"), timeout=timeout)
+                else:
+                    # Fallback: click Previous until it becomes disabled
+                    prev = prev_btn_locator()
+                    if prev.count() > 0:
+                        for _ in range(10):
+                            if is_disabled(prev):
+                                break
+                            prev.click(force=True)
+                            self.wait_until(lambda: True, timeout_ms=200)
 
             # --------------------------------------------------
             # Iterate pages
@@ -2178,12 +2197,8 @@ class AlarmsAndEvents:
             for page_idx in range(1, total_pages + 1):
 
                 rows = get_rows()
-                self.wait_until(lambda: rows.count() >= 0, timeout_ms=timeout)
-
-                for i in range(rows.count()):
-                    r = rows.nth(i)
-                    item = parse_row(r)
 
+                for item in read_page_rows(rows):
                     key = (
                         item["message"],
                         item["detection_timestamp"],
@@ -2206,6 +2221,7 @@ class AlarmsAndEvents:
 
                     # self.wait_until(lambda: page_signature() != before or is_disabled(nxt), timeout_ms=timeout)
 
+            self._alarms_cache = (time.monotonic(), [dict(r) for r in results])
             return results
 
         except Exception as e:
@@ -3,14 +3,113 @@ Created by: Yuval Dahan
 Date: 28/01/2026
 """
 
+import os
 import re
-import time
+import functools
 from time import sleep
-from typing import Union, Callable
+from typing import Union, Optional
 
 from Utils.utils import refresh_page, countdown_sleep
 
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Page, expect, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+
+# Default wait for DeviceDiscovery actions/assertions (override with DD_TIMEOUT_MS)
+DEFAULT_TIMEOUT_MS = int(os.getenv("DD_TIMEOUT_MS", "3000"))
+
+# Short wait for a clicked dropdown's menu to render before the keyboard fallback
+DROPDOWN_OPEN_WAIT_MS = 1500
+
+# Success-path wait: Start Discovery backend call, toast and overlay (override with DD_SUCCESS_TIMEOUT_MS)
+SUCCESS_TIMEOUT_MS = int(os.getenv("DD_SUCCESS_TIMEOUT_MS", "8000"))
+
+SEL_CONTAINER = "div.device-discovery-container"
+SEL_HEADER = "div.device-discovery-header"
+SEL_CONTENT = "div.device-discovery-content"
+SEL_FOOTER = "footer"
+SEL_TABSET = "tabset.tab-container"
+SEL_TAB_LINK = "ul.nav.nav-tabs a.nav-link"
+SEL_ACTIVE_PANE = "div.tab-content tab.active.tab-pane"
+SEL_DD_BTN = "button.dropdown-button, button[dropdowntoggle]"
+SEL_DD_MENU = "div.dropdown-menu"
+SEL_DD_ITEM = "li.dropdown-item"
+SEL_DD_SELECTED = ".selected-view span"
+SEL_RANGE_ON_KNOB = "rect[fill='#FFFFFF']"
+SEL_INPUT_WRAPPER = "div.input-wrapper"
+SEL_INVALID_ICON = "div.error-icon app-icon[name='input-field-invalid']"
+
+_WS_RE = re.compile(r"\s+")
+
+# fill() errors meaning "this field does not accept fill()" (the only ones fill_input falls back on)
+_CANNOT_FILL_RE = re.compile(r"not an <input>|cannot be filled|cannot type text into", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=128)
+def _exact_ci(text: str) -> re.Pattern:
+    """
+    Case-insensitive full-text match (surrounding whitespace ignored).
+    """
+    return re.compile(rf"^\s*{re.escape(text)}\s*$", re.IGNORECASE)
+
+
+# SNMPv3 level-dependent fields: (SNMPv3_expected_fields key, set_SNMPv3_<suffix> setter)
+SNMPV3_LEVEL_FIELDS = (
+    ("auth_protocol", "authentication_protocol"),
+    ("auth_password", "authentication_password"),
+    ("privacy_protocol", "privacy_protocol"),
+    ("privacy_password", "privacy_password"),
+)
+
+# True once the tab pane is the active one and actually rendered
+_TAB_PANE_ACTIVE_JS = """
+sel => {
+    const t = document.querySelector(sel);
+    return !!t && t.classList.contains('active') && t.offsetParent !== null;
+}
+"""
+
+# Resolve where a dropdown's menu is rendered: inside the dropdown, or as an overlay linked by aria-labelledby / data-label
+_DROPDOWN_MENU_MODE_JS = """
+(dd, {label, btnSel, menuSel}) => {
+    const btn = dd.querySelector(btnSel);
+    if (!btn) return {mode: 'no-button', btnId: null};
+    if (dd.querySelector(menuSel)) return {mode: 'inside', btnId: btn.id};
+    if (btn.id && document.querySelector(`${menuSel}[aria-labelledby='${btn.id}']`)) return {mode: 'aria', btnId: btn.id};
+    if (document.querySelector(`${menuSel}[data-label='${label}']`)) return {mode: 'label', btnId: btn.id};
+    return {mode: null, btnId: btn.id};
+}
+"""
+
+# Cleaned text of every option item in one round-trip
+_OPTION_TEXTS_JS = "els => els.map(e => e.textContent.replace(/\\s+/g, ' ').trim()).filter(Boolean)"
+
+# Write {formcontrolname: value} into the active tab pane's inputs and fire the events Angular listens to
+_SET_PANE_INPUTS_JS = """
+(tabset, vals) => {
+    const pane = tabset.querySelector('div.tab-content tab.active.tab-pane');
+    if (!pane) throw new Error('active tab pane not found');
+    for (const [fcn, v] of Object.entries(vals)) {
+        const el = pane.querySelector(`app-input[formcontrolname='${fcn}'] input`);
+        if (!el) throw new Error(`app-input not found (formcontrolname='${fcn}')`);
+        el.value = v;
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.dispatchEvent(new Event('blur', {bubbles: true}));
+    }
+}
+"""
+
+# [{selector, visible}] -> [isVisible] (same box/visibility rule Playwright uses)
+_FIELDS_VISIBILITY_JS = """
+specs => specs.map(({selector}) => {
+    const el = document.querySelector(selector);
+    if (!el) return false;
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+})
+"""
+
+_FIELDS_VISIBILITY_MATCH_JS = f"specs => ({_FIELDS_VISIBILITY_JS})(specs).every((v, i) => v === specs[i].visible)"
 
 
 class DeviceDiscovery:
@@ -22,39 +121,79 @@ class DeviceDiscovery:
     def __init__(self, page: Page):
         self.page = page
 
-    # ==========================================================
-    # Internal small helpers
-    # ==========================================================
+        # Lazily resolved locators (reset with invalidate_cache)
+        self._container = None
+        self._header = None
+        self._content = None
+        self._footer = None
+        self._tabset = None
+        self._app_inputs = {}
+        self._active_tab: Optional[str] = None
+        self._toggle_svg_handle = None
+        self._loc_cache = {}
+        self._snmpv3_level: Optional[str] = None          # last Security Level set through set_SNMPv3_security_level
+        self._snmpv3_vis_cache: dict[str, dict] = {}      # level (lower) -> expected field visibility
+
+        # Cached locators/handles go stale on navigation - drop them automatically
+        self.page.on("framenavigated", self._on_frame_navigated)
 
     # ✅
-    def wait_until(self, condition: Callable[[], bool], timeout_ms: int = 10000, interval_ms: int = 200):
+    def _on_frame_navigated(self, frame):
         """
-        Polls condition() until it returns True or timeout.
-        Raises AssertionError on timeout.
+        framenavigated listener: invalidate caches when the main frame navigates.
         """
-        end_time = time.time() + (timeout_ms / 1000.0)
-        last_exc = None
+        if frame == self.page.main_frame:
+            self.invalidate_cache()
 
-        while time.time() < end_time:
-            try:
-                if condition():
-                    return
-                last_exc = None
-            except Exception as e:
-                last_exc = e
-
-            time.sleep(interval_ms / 1000.0)
+    # ✅
+    def invalidate_cache(self):
+        """
+        Drop all cached locators, tab state and element handles.
+        Runs automatically on main-frame navigation.
+        """
+        self._container = None
+        self._header = None
+        self._content = None
+        self._footer = None
+        self._tabset = None
+        self._app_inputs = {}
+        self._active_tab = None
+        self._loc_cache = {}
+        self._snmpv3_level = None
+        self._dispose_toggle_svg_handle()
 
-        if last_exc:
-            raise AssertionError(f"Condition not met within {timeout_ms}ms. Last error: {last_exc}")
-        raise AssertionError(f"Condition not met within {timeout_ms}ms.")
+    # ==========================================================
+    # Internal small helpers
+    # ==========================================================
 
     # ✅
     def clean(self, s: str) -> str:
         """
         Normalize whitespace and strip.
         """
-        return re.sub(r"\s+", " ", (s or "").strip())
+        return _WS_RE.sub(" ", (s or "").strip())
+
+    # ✅
+    def fill_input(self, inp, value: str, timeout: int = DEFAULT_TIMEOUT_MS, use_keystrokes: bool = False):
+        """
+        Set an <input> value in one call.
+        Falls back to select-all + typing for inputs that reject fill(),
+        or types directly when use_keystrokes=True (fields that react to per-key events).
+        """
+        if not use_keystrokes:
+            try:
+                inp.fill(str(value), timeout=timeout)
+                return
+            except PlaywrightTimeoutError:
+                raise
+            except PlaywrightError as e:
+                # Missing element, detached node, etc. -> report the real cause instead of a fallback timeout
+                if not _CANNOT_FILL_RE.search(str(e)):
+                    raise
+
+        inp.click(force=True, timeout=timeout)
+        inp.press("Control+A", timeout=timeout)
+        inp.type(str(value), delay=5, timeout=timeout)
     
     # ==========================================================
     # Base locators
@@ -65,32 +204,36 @@ class DeviceDiscovery:
         """
         Return the device discovery container.
         """
-        container = self.page.locator("div.device-discovery-container").first
-        sleep(3)
-        if container.count() == 0:
-            raise AssertionError("DeviceDiscovery: container not found (div.device-discovery-container).")
-        return container
+        if self._container is None:
+            self._container = self.page.locator(SEL_CONTAINER).first
+        return self._container
 
     # ✅
     def header(self):
         """
         Return header section (title + controls).
         """
-        return self.container().locator("div.device-discovery-header").first
+        if self._header is None:
+            self._header = self.container().locator(SEL_HEADER).first
+        return self._header
 
     # ✅
     def content(self):
         """
         Return content section (fields + tabs).
         """
-        return self.container().locator("div.device-discovery-content").first
+        if self._content is None:
+            self._content = self.container().locator(SEL_CONTENT).first
+        return self._content
 
     # ✅
     def footer(self):
         """
         Return footer section (Reset/Save/Start Discovery).
         """
-        return self.container().locator("footer").first
+        if self._footer is None:
+            self._footer = self.container().locator(SEL_FOOTER).first
+        return self._footer
 
     # ==========================================================
     # Header controls
@@ -101,30 +244,48 @@ class DeviceDiscovery:
         """
         Return the Range slide-toggle component in the header.
         """
-        toggle = self.header().locator("div.controls app-slide-toggle:has-text('Range')").first
-        if toggle.count() == 0:
-            raise AssertionError("DeviceDiscovery: Range toggle not found (app-slide-toggle with text 'Range').")
-        return toggle
+        return self.header().locator("div.controls app-slide-toggle:has-text('Range')").first
+
+    # ✅
+    def _dispose_toggle_svg_handle(self):
+        """
+        Release the cached Range toggle SVG handle (if any).
+        """
+        if self._toggle_svg_handle is not None:
+            try:
+                self._toggle_svg_handle.dispose()
+            except Exception:
+                pass
+            self._toggle_svg_handle = None
 
     # ✅
     def is_range_enabled(self) -> bool:
         """
         Return True if Range toggle is ON according to the SVG knob position.
         """
-        t = self.range_toggle()
-        svg = t.locator("svg").first
-
         # OFF: knob is a 16x16 rect at x=16
-        # ON : knob is a 24x24 rect at x=32
-        knob = svg.locator("rect[fill='#FFFFFF']").first  # exists only when ON
-        if knob.count() > 0:
-            return True
+        # ON : knob is a 24x24 rect at x=32 (white rect exists only when ON)
+        # The SVG handle is kept between calls; re-resolved only if Angular replaced the node.
+        for _ in range(2):
+            try:
+                if self._toggle_svg_handle is None:
+                    svg = self.range_toggle().locator("svg").first
+                    # Toggle missing -> not enabled, without waiting (this runs inside polls)
+                    if svg.count() == 0:
+                        return False
+                    self._toggle_svg_handle = svg.element_handle(timeout=1000)
 
-        knob_off = svg.locator("rect[x='16'][y='16'][width='16'][height='16']").first
-        if knob_off.count() > 0:
-            return False
+                state = self._toggle_svg_handle.evaluate(
+                    """svg => svg.isConnected ? svg.querySelector("rect[fill='#FFFFFF']") !== null : null"""
+                )
+            except Exception:
+                state = None
+
+            if state is not None:
+                return bool(state)
+            # Stale (detached) or unreadable handle: release it before re-resolving
+            self._dispose_toggle_svg_handle()
 
-        # Fallback: if DOM changed, consider not enabled
         return False
 
     # ✅
@@ -143,10 +304,7 @@ class DeviceDiscovery:
         """
         Return the app-input container for the IP address field.
         """
-        inp = self.content().locator("app-input[formcontrolname='ip']").first
-        if inp.count() == 0:
-            raise AssertionError("DeviceDiscovery: IP app-input not found (formcontrolname='ip').")
-        return inp
+        return self.content().locator("app-input[formcontrolname='ip']").first
 
     # ✅
     def ip_input(self):
@@ -157,7 +315,7 @@ class DeviceDiscovery:
         return self.ip_app_input().locator("input:visible").first
 
     # ✅
-    def set_ip_address(self, ip: str, timeout: int = 8000):
+    def set_ip_address(self, ip: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set IP address field (single IP mode).
         """
@@ -166,39 +324,29 @@ class DeviceDiscovery:
             if self.is_range_enabled():
                 raise AssertionError("Range mode is enabled. Use set_range_start_ip/set_range_end_ip instead.")
 
+            # fill() already waits for visible + enabled + editable
             inp = self.ip_input()
-            expect(inp).to_be_visible(timeout=timeout)
-            expect(inp).to_be_enabled(timeout=timeout)
-            expect(inp).to_be_editable(timeout=timeout)
-
-            inp.scroll_into_view_if_needed()
-            inp.click(force=True)
-
-            # More robust than fill() on some Angular inputs
-            inp.press("Control+A")
-            inp.type(str(ip), delay=5)
+            inp.wait_for(state="visible", timeout=timeout)
+            self.fill_input(inp, ip, timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"set_ip_address('{ip}') failed. Problem: {e}")
 
     # ✅
-    def get_ip_address(self, timeout: int = 8000) -> str:
+    def get_ip_address(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get IP address field value.
         """
         try:
-            inp = self.ip_app_input().locator("input:visible").first
-
-            expect(inp).to_be_visible(timeout=timeout)
-            expect(inp).to_be_enabled(timeout=timeout)
-
-            return self.clean(inp.input_value())
+            inp = self.ip_input()
+            inp.wait_for(state="visible", timeout=timeout)
+            return self.clean(inp.input_value(timeout=timeout))
 
         except Exception as e:
             raise AssertionError(f"get_ip_address failed. Problem: {e}")
     
     # ✅
-    def is_ip_address_field_valid(self, timeout: int = 8000) -> bool:
+    def is_ip_address_field_valid(self, timeout: int = DEFAULT_TIMEOUT_MS) -> bool:
         """
         Return True if the IP address field is valid.
         Return False if invalid (red error state + '!' icon).
@@ -208,7 +356,7 @@ class DeviceDiscovery:
             expect(ip).to_be_visible(timeout=timeout)
 
             # Wrapper has class "error"
-            wrapper = ip.locator("div.input-wrapper").first
+            wrapper = ip.locator(SEL_INPUT_WRAPPER).first
             sleep(2)
 
             if wrapper.count() > 0:
@@ -217,7 +365,7 @@ class DeviceDiscovery:
                     return False
 
             # Explicit invalid icon exists/visible
-            invalid_icon = ip.locator("div.error-icon app-icon[name='input-field-invalid']").first
+            invalid_icon = ip.locator(SEL_INVALID_ICON).first
             sleep(2)
 
             if invalid_icon.count() > 0:
@@ -243,7 +391,7 @@ class DeviceDiscovery:
     # =========================
 
     # ✅
-    def click_start_discovery_for_ip_range(self, timeout: int = 8000):
+    def click_start_discovery_for_ip_range(self, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Enable Range toggle (IP range discovery).
         """
@@ -259,14 +407,14 @@ class DeviceDiscovery:
             expect(svg).to_be_visible(timeout=timeout)
             svg.click(force=True)
 
-            # Wait until toggle becomes enabled
-            self.wait_until(lambda: self.is_range_enabled(), timeout_ms=timeout, interval_ms=200)
+            # Wait until toggle becomes enabled (white knob exists only when ON)
+            expect(svg.locator(SEL_RANGE_ON_KNOB).first).to_be_attached(timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"click_start_discovery_for_ip_range failed. Problem: {e}")
 
     # ✅
-    def click_stop_discovery_for_ip_range(self, timeout: int = 8000):
+    def click_stop_discovery_for_ip_range(self, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Disable Range toggle (return to single IP discovery).
         """
@@ -283,28 +431,26 @@ class DeviceDiscovery:
             expect(svg).to_be_visible(timeout=timeout)
             svg.click(force=True)
 
-            # Wait until toggle becomes disabled
-            self.wait_until(lambda: not self.is_range_enabled(), timeout_ms=timeout, interval_ms=200)
+            # Wait until toggle becomes disabled (white knob removed)
+            expect(svg.locator(SEL_RANGE_ON_KNOB)).to_have_count(0, timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"click_stop_discovery_for_ip_range failed. Problem: {e}")
 
     # ✅
-    def set_range_start_ip(self, start_ip: str, timeout: int = 8000):
+    def set_range_start_ip(self, start_ip: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set the Start IP field (Range mode).
         """
         try:
             inp = self.app_input_field("startIP")
             expect(inp).to_be_visible(timeout=timeout)
-            inp.click(force=True)
-            inp.fill("")
-            inp.type(str(start_ip), delay=5)
+            self.fill_input(inp, start_ip, timeout=timeout)
         except Exception as e:
             raise AssertionError(f"set_range_start_ip('{start_ip}') failed. Problem: {e}")
 
     # ✅
-    def get_range_start_ip(self, timeout: int = 8000) -> str:
+    def get_range_start_ip(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get the Start IP field value (Range mode).
         """
@@ -316,21 +462,19 @@ class DeviceDiscovery:
             raise AssertionError(f"get_range_start_ip failed. Problem: {e}")
 
     # ✅
-    def set_range_end_ip(self, end_ip: str, timeout: int = 8000):
+    def set_range_end_ip(self, end_ip: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set the End IP field (Range mode).
         """
         try:
             inp = self.app_input_field("endIP")
             expect(inp).to_be_visible(timeout=timeout)
-            inp.click(force=True)
-            inp.fill("")
-            inp.type(str(end_ip), delay=5)
+            self.fill_input(inp, end_ip, timeout=timeout)
         except Exception as e:
             raise AssertionError(f"set_range_end_ip('{end_ip}') failed. Problem: {e}")
 
     # ✅
-    def get_range_end_ip(self, timeout: int = 8000) -> str:
+    def get_range_end_ip(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get the End IP field value (Range mode).
         """
@@ -342,7 +486,7 @@ class DeviceDiscovery:
             raise AssertionError(f"get_range_end_ip failed. Problem: {e}")
 
     # ✅
-    def is_range_start_ip_field_valid(self, timeout: int = 8000) -> bool:
+    def is_range_start_ip_field_valid(self, timeout: int = DEFAULT_TIMEOUT_MS) -> bool:
         """
         Return True if the Range Start IP field is valid.
         Return False if invalid (red error state + 'ng-invalid').
@@ -352,7 +496,7 @@ class DeviceDiscovery:
             expect(ip).to_be_visible(timeout=timeout)
 
             # Wrapper error class
-            wrapper = ip.locator("div.input-wrapper").first
+            wrapper = ip.locator(SEL_INPUT_WRAPPER).first
             self.page.wait_for_timeout(200)
 
             if wrapper.count() > 0:
@@ -371,7 +515,7 @@ class DeviceDiscovery:
             raise AssertionError(f"is_range_start_ip_field_valid failed. Problem: {e}")
 
     # ✅
-    def is_range_end_ip_field_valid(self, timeout: int = 8000) -> bool:
+    def is_range_end_ip_field_valid(self, timeout: int = DEFAULT_TIMEOUT_MS) -> bool:
         """
         Return True if the Range End IP field is valid.
         Return False if invalid (red error state + 'ng-invalid').
@@ -381,7 +525,7 @@ class DeviceDiscovery:
             expect(ip).to_be_visible(timeout=timeout)
 
             # Wrapper error class
-            wrapper = ip.locator("div.input-wrapper").first
+            wrapper = ip.locator(SEL_INPUT_WRAPPER).first
             self.page.wait_for_timeout(200)
 
             if wrapper.count() > 0:
@@ -399,7 +543,6 @@ class DeviceDiscovery:
         except Exception as e:
             raise AssertionError(f"is_range_end_ip_field_valid failed. Problem: {e}")
 
-
     # ==========================================================
     # Protocol tabs (ICMP / SNMPv2 / SNMPv3)
     # ==========================================================
@@ -410,29 +553,41 @@ class DeviceDiscovery:
         Return protocol tabset container.
         """
         try:
-            ts = self.content().locator("tabset.tab-container").first
-            self.wait_until(lambda: ts.count() > 0 and ts.is_visible(), timeout_ms=timeout, interval_ms=200)
-            return ts
+            if self._tabset is None:
+                ts = self.content().locator(SEL_TABSET).first
+                expect(ts).to_be_visible(timeout=timeout)
+                self._tabset = ts
+            return self._tabset
 
         except Exception as e:
             raise AssertionError(f"protocol_tabset failed. Problem: {e}")
     
+    # ✅
+    def _ensure_tab(self, tab_name: str, timeout: int = 10000):
+        """
+        Switch to a protocol tab only if it is not already the active one.
+        """
+        if self._active_tab == tab_name:
+            return
+        self.click_protocol_tab(tab_name, timeout=timeout)
+
     # ✅
     def click_protocol_tab(self, tab_name: str, timeout: int = 10000):
         """
         Click protocol tab by name and assert the tab content becomes active.
         """
         try:
+            self._active_tab = None
             tabset = self.protocol_tabset(timeout=timeout)
 
-            tab_btn = tabset.locator("ul.nav.nav-tabs a.nav-link", has_text=re.compile(rf"^\s*{re.escape(tab_name)}\s*$")).first
+            tab_btn = tabset.locator(SEL_TAB_LINK, has_text=_exact_ci(tab_name)).first
             expect(tab_btn).to_be_visible(timeout=timeout)
             tab_btn.click(force=True)
 
-            # Assert the tab pane became active (this is more stable than the <a>.active)
-            tab_pane = tabset.locator(f"div.tab-content tab[heading='{tab_name}']").first
-
-            self.wait_until(lambda: tab_pane.count() > 0 and tab_pane.is_visible() and ("active" in (tab_pane.get_attribute("class") or "")), timeout_ms=timeout)
+            # Assert the tab pane became active (this is more stable than the <a>.active) - polled in-page
+            pane_selector = f"{SEL_CONTENT} {SEL_TABSET} div.tab-content tab[heading='{tab_name}']"
+            self.page.wait_for_function(_TAB_PANE_ACTIVE_JS, arg=pane_selector, timeout=timeout)
+            self._active_tab = tab_name
 
         except Exception as e:
             raise AssertionError(f"click_protocol_tab('{tab_name}') failed. Problem: {e}")
@@ -440,23 +595,23 @@ class DeviceDiscovery:
     # ✅
     def click_ICMP(self, timeout: int = 10000):
         """
-        Switch to ICMP tab.
+        Switch to ICMP tab (no-op if it is already active).
         """
-        self.click_protocol_tab("ICMP", timeout=timeout)
+        self._ensure_tab("ICMP", timeout=timeout)
 
     # ✅
     def click_SNMPv2(self, timeout: int = 10000):
         """
-        Switch to SNMPv2 tab.
+        Switch to SNMPv2 tab (no-op if it is already active).
         """
-        self.click_protocol_tab("SNMPv2", timeout=timeout)
+        self._ensure_tab("SNMPv2", timeout=timeout)
 
     # ✅
     def click_SNMPv3(self, timeout: int = 10000):
         """
-        Switch to SNMPv3 tab.
+        Switch to SNMPv3 tab (no-op if it is already active).
         """
-        self.click_protocol_tab("SNMPv3", timeout=timeout)
+        self._ensure_tab("SNMPv3", timeout=timeout)
 
     # ==========================================================
     # app-input helpers
@@ -468,49 +623,42 @@ class DeviceDiscovery:
         Return the currently active tab-pane under the protocol tabset.
         """
         ts = self.protocol_tabset()
-        pane = ts.locator("div.tab-content tab.active.tab-pane").first
-        sleep(3)
-        if pane.count() == 0:
-            raise AssertionError("DeviceDiscovery: active tab pane not found.")
-        return pane
+        return ts.locator(SEL_ACTIVE_PANE).first
 
     # ✅
     def app_input(self, formcontrolname: str, scope=None):
         """
         Return app-input.
         """
-        root = scope if scope is not None else self.container()
-        loc = root.locator(f"app-input[formcontrolname='{formcontrolname}']").first
-        if loc.count() == 0:
-            raise AssertionError(f"DeviceDiscovery: app-input not found (formcontrolname='{formcontrolname}').")
-        return loc
+        selector = f"app-input[formcontrolname='{formcontrolname}']"
+        if scope is not None:
+            return scope.locator(selector).first
+
+        if formcontrolname not in self._app_inputs:
+            self._app_inputs[formcontrolname] = self.container().locator(selector).first
+        return self._app_inputs[formcontrolname]
 
     # ✅
     def app_input_field(self, formcontrolname: str, scope=None):
         """
         Return <input> inside app-input.
         """
-        app_input = self.app_input(formcontrolname, scope=scope).locator("input").first
-        sleep(0.5)
-        return app_input
+        return self.app_input(formcontrolname, scope=scope).locator("input").first
 
     # ✅
-    def set_app_input_value(self, formcontrolname: str, value: str, timeout: int = 8000, scope=None):
+    def set_app_input_value(self, formcontrolname: str, value: str, timeout: int = DEFAULT_TIMEOUT_MS, scope=None):
         """
         Fill an app-input.
         """
         try:
             inp = self.app_input_field(formcontrolname, scope=scope)
             expect(inp).to_be_visible(timeout=timeout)
-            inp.click(force=True)
-            inp.fill("")
-            sleep(3)
-            inp.type(str(value), delay=5)
+            self.fill_input(inp, value, timeout=timeout)
         except Exception as e:
             raise AssertionError(f"set_app_input_value('{formcontrolname}', '{value}') failed. Problem: {e}")
 
     # ✅
-    def get_app_input_value(self, formcontrolname: str, timeout: int = 8000, scope=None) -> str:
+    def get_app_input_value(self, formcontrolname: str, timeout: int = DEFAULT_TIMEOUT_MS, scope=None) -> str:
         """
         Read an app-input value.
         """
@@ -526,113 +674,116 @@ class DeviceDiscovery:
     # ==========================================================
     
     # ✅
-    def app_dropdown(self, label: str):
+    def app_dropdown(self, label: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Return app-dropdown by label.
         """
         dropdown = self.container().locator(f"app-dropdown[label='{label}']").first
-        sleep(1)
-        if dropdown.count() == 0:
+        try:
+            expect(dropdown).to_be_attached(timeout=timeout)
+        except AssertionError:
             raise AssertionError(f"DeviceDiscovery: dropdown not found (label='{label}').")
         return dropdown
 
     # ✅
-    def dropdown_selected_text(self, label: str, timeout: int = 8000) -> str:
+    def dropdown_selected_text(self, label: str, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Return current selected text of a dropdown.
         """
         try:
-            dropdown = self.app_dropdown(label)
-            selected = dropdown.locator(".selected-view span").first
+            dropdown = self.app_dropdown(label, timeout=timeout)
+            selected = dropdown.locator(SEL_DD_SELECTED).first
             expect(selected).to_be_visible(timeout=timeout)
             return self.clean(selected.inner_text())
         except Exception as e:
             raise AssertionError(f"dropdown_selected_text('{label}') failed. Problem: {e}")
 
     # ✅
-    def open_dropdown(self, label: str, timeout: int = 8000):
+    def open_dropdown(self, label: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Open a dropdown by label.
         """
         try:
-            dropdown = self.app_dropdown(label)
-            btn = dropdown.locator("button.dropdown-button, button[dropdowntoggle]").first
+            dropdown = self.app_dropdown(label, timeout=timeout)
+            btn = dropdown.locator(SEL_DD_BTN).first
             expect(btn).to_be_visible(timeout=timeout)
             btn.click(force=True)
         except Exception as e:
             raise AssertionError(f"open_dropdown('{label}') failed. Problem: {e}")
 
     # ✅
-    def dropdown_pick(self, label: str, value: str, timeout: int = 8000):
+    def dropdown_pick(self, label: str, value: str, timeout: int = DEFAULT_TIMEOUT_MS, menu=None):
         """
         Pick a value from a labeled dropdown.
+        Pass an already opened menu to skip re-opening it.
         """
         try:
-            menu = self.open_dropdown_menu(label, timeout=timeout)
+            if label == "Security Level":
+                self._snmpv3_level = None  # cached SNMPv3 level is stale once the dropdown changes
 
-            item = menu.locator("li.dropdown-item", has_text=re.compile(rf"^\s*{re.escape(value)}\s*$", re.IGNORECASE)).first
+            if menu is None:
+                menu = self.open_dropdown_menu(label, timeout=timeout)
+
+            item = menu.locator(SEL_DD_ITEM, has_text=_exact_ci(value.strip())).first
 
             if item.count() == 0:
-                options = menu.locator("li.dropdown-item").all_inner_texts()
-                options = [self.clean(x) for x in options if self.clean(x)]
+                options = menu.locator(SEL_DD_ITEM).evaluate_all(_OPTION_TEXTS_JS)
                 raise AssertionError(f"Value '{value}' not found in '{label}'. Available: {options}")
 
             item.scroll_into_view_if_needed()
             item.click(force=True)
 
             # Wait for selected-view to update
-            self.wait_until(lambda: self.dropdown_selected_text(label, timeout=timeout).strip().lower() == value.strip().lower(), timeout_ms=timeout, interval_ms=150)
+            selected = self.app_dropdown(label, timeout=timeout).locator(SEL_DD_SELECTED).first
+            expect(selected).to_have_text(_exact_ci(value.strip()), timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"dropdown_pick('{label}', '{value}') failed. Problem: {e}")
 
     # ✅
-    def set_dropdown_with_validation(self, label: str, value: str, timeout: int = 8000):
+    def set_dropdown_with_validation(self, label: str, value: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Validate the value exists in the dropdown and then select it.
         """
         try:
             menu = self.open_dropdown_menu(label, timeout=timeout)
 
-            options = menu.locator("li.dropdown-item").all_inner_texts()
-            options = [self.clean(x) for x in options if self.clean(x)]
+            options = menu.locator(SEL_DD_ITEM).evaluate_all(_OPTION_TEXTS_JS)
 
-            if value.strip() not in [o.strip() for o in options]:
+            if value.strip().lower() not in [o.lower() for o in options]:
                 raise AssertionError(f"'{value}' not found in '{label}'. Available values: {options}")
 
-            self.dropdown_pick(label, value, timeout=timeout)
+            self.dropdown_pick(label, value, timeout=timeout, menu=menu)
 
         except Exception as e:
             raise AssertionError(f"set_dropdown_with_validation('{label}', '{value}') failed. Problem: {e}")
 
     # ✅
-    def dropdown_menu(self, label: str, timeout: int = 8000):
+    def dropdown_menu(self, label: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Return the dropdown menu for a labeled dropdown.
         Works whether the menu is rendered inside the dropdown or as an overlay.
         """
-        dd = self.app_dropdown(label)
+        dd = self.app_dropdown(label, timeout=timeout)
+
+        # One in-page lookup instead of probing each strategy separately
+        found = dd.evaluate(_DROPDOWN_MENU_MODE_JS, {"label": label, "btnSel": SEL_DD_BTN, "menuSel": SEL_DD_MENU})
+        mode, btn_id = found["mode"], found["btnId"]
 
-        btn = dd.locator("button.dropdown-button, button[dropdowntoggle]").first
-        if btn.count() == 0:
+        if mode == "no-button":
             raise AssertionError(f"DeviceDiscovery: dropdown button not found (label='{label}').")
 
-        # 1) First try: menu inside the dropdown
-        menu_inside = dd.locator("div.dropdown-menu").first
-        if menu_inside.count() > 0:
-            return menu_inside
+        # 1) Menu inside the dropdown
+        if mode == "inside":
+            return dd.locator(SEL_DD_MENU).first
 
-        # 2) Second try: menu rendered as overlay, linked by aria-labelledby to button id
-        btn_id = btn.get_attribute("id")
-        if btn_id:
-            menu_by_aria = self.page.locator(f"div.dropdown-menu[aria-labelledby='{btn_id}']").first
-            if menu_by_aria.count() > 0:
-                return menu_by_aria
+        # 2) Menu rendered as overlay, linked by aria-labelledby to button id
+        if mode == "aria":
+            return self.page.locator(f"{SEL_DD_MENU}[aria-labelledby='{btn_id}']").first
 
         # 3) Last fallback: by data-label (if exists)
-        menu_by_label = self.page.locator(f"div.dropdown-menu[data-label='{label}']").first
-        if menu_by_label.count() > 0:
-            return menu_by_label
+        if mode == "label":
+            return self.page.locator(f"{SEL_DD_MENU}[data-label='{label}']").first
 
         raise AssertionError(
             f"DeviceDiscovery: dropdown menu not found (label='{label}'). "
@@ -640,40 +791,39 @@ class DeviceDiscovery:
         )
 
     # ✅
-    def try_open_dropdown_menu(self, label: str, timeout: int = 8000):
+    def try_open_dropdown_menu(self, label: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Best-effort open for a dropdown. Returns the menu if visible, else None.
         """
-        dd = self.app_dropdown(label)
-        btn = dd.locator("button.dropdown-button, button[dropdowntoggle]").first
+        dd = self.app_dropdown(label, timeout=timeout)
+        btn = dd.locator(SEL_DD_BTN).first
         expect(btn).to_be_visible(timeout=timeout)
 
-        attempts = [
-            lambda: btn.click(force=True),
-            lambda: btn.click(force=True),
-            lambda: btn.press("Enter"),
-            lambda: btn.press("Space"),
-            lambda: btn.press("ArrowDown"),
-        ]
+        btn.click(force=True)
 
-        for act in attempts:
-            try:
-                act()
-            except Exception:
-                pass
-
-            try:
-                menu = self.dropdown_menu(label, timeout=timeout)  # <-- now after click
-                self.wait_until(lambda: menu.count() > 0 and menu.is_visible(), timeout_ms=min(timeout, 1500), interval_ms=150)
-                if menu.is_visible():
-                    return menu
-            except Exception:
-                pass
+        # The menu may render asynchronously as an overlay - give any of its placements a short chance to show
+        # before falling back to Enter (which would toggle an already-open menu closed again)
+        btn_id = btn.get_attribute("id", timeout=timeout)
+        any_menu = dd.locator(SEL_DD_MENU).or_(self.page.locator(f"{SEL_DD_MENU}[data-label='{label}']"))
+        if btn_id:
+            any_menu = any_menu.or_(self.page.locator(f"{SEL_DD_MENU}[aria-labelledby='{btn_id}']"))
+        try:
+            expect(any_menu.first).to_be_visible(timeout=min(timeout, DROPDOWN_OPEN_WAIT_MS))
+            return self.dropdown_menu(label, timeout=timeout)
+        except AssertionError:
+            pass
 
-        return None
+        # Fallback: keyboard open
+        try:
+            btn.press("Enter")
+            menu = self.dropdown_menu(label, timeout=timeout)
+            expect(menu).to_be_visible(timeout=timeout)
+            return menu
+        except (AssertionError, PlaywrightTimeoutError):
+            return None
 
     # ✅
-    def open_dropdown_menu(self, label: str, timeout: int = 8000):
+    def open_dropdown_menu(self, label: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Open dropdown and return its menu locator.
         """
@@ -695,71 +845,87 @@ class DeviceDiscovery:
     # ==========================================================
 
     # ✅
-    def set_SNMPv2_read_community(self, value: str, timeout: int = 8000):
+    def set_pane_fields(self, tab_name: str, fields: dict, timeout: int = DEFAULT_TIMEOUT_MS):
+        """
+        Switch to tab_name once and set all {formcontrolname: value} inputs of its pane in one call.
+        """
+        try:
+            self._ensure_tab(tab_name, timeout=timeout)
+            values = {fcn: str(v) for fcn, v in fields.items()}
+            self.protocol_tabset(timeout=timeout).evaluate(_SET_PANE_INPUTS_JS, values)
+        except Exception as e:
+            raise AssertionError(f"set_pane_fields('{tab_name}', {list(fields)}) failed. Problem: {e}")
+
+    # ✅
+    def set_SNMPv2_fields(self, timeout: int = DEFAULT_TIMEOUT_MS, **fields):
+        """
+        Set several SNMPv2 inputs at once.
+        Keys are formcontrolnames: readCommunity, writeCommunity, adminCommunity, contactPort.
+        """
+        self.set_pane_fields("SNMPv2", fields, timeout=timeout)
+
+    # ✅
+    def set_SNMPv2_read_community(self, value: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set SNMPv2 Read Community.
         """
-        self.click_SNMPv2()
-        self.set_app_input_value("readCommunity", value, timeout=timeout)
+        self.set_SNMPv2_fields(readCommunity=value, timeout=timeout)
 
     # ✅
-    def get_SNMPv2_read_community(self, timeout: int = 8000) -> str:
+    def get_SNMPv2_read_community(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv2 Read Community.
         """
-        self.click_SNMPv2()
+        self._ensure_tab("SNMPv2")
         return self.get_app_input_value("readCommunity", timeout=timeout)
 
     # ✅
-    def set_SNMPv2_write_community(self, value: str, timeout: int = 8000):
+    def set_SNMPv2_write_community(self, value: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set SNMPv2 Write Community.
         """
-        self.click_SNMPv2()
-        self.set_app_input_value("writeCommunity", value, timeout=timeout)
+        self.set_SNMPv2_fields(writeCommunity=value, timeout=timeout)
 
     # ✅
-    def get_SNMPv2_write_community(self, timeout: int = 8000) -> str:
+    def get_SNMPv2_write_community(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv2 Write Community.
         """
-        self.click_SNMPv2()
+        self._ensure_tab("SNMPv2")
         return self.get_app_input_value("writeCommunity", timeout=timeout)
 
     # ✅
-    def set_SNMPv2_admin_community(self, value: str, timeout: int = 8000):
+    def set_SNMPv2_admin_community(self, value: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set SNMPv2 Admin Community.
         """
-        self.click_SNMPv2()
-        self.set_app_input_value("adminCommunity", value, timeout=timeout)
+        self.set_SNMPv2_fields(adminCommunity=value, timeout=timeout)
 
     # ✅
-    def get_SNMPv2_admin_community(self, timeout: int = 8000) -> str:
+    def get_SNMPv2_admin_community(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv2 Admin Community.
         """
-        self.click_SNMPv2()
+        self._ensure_tab("SNMPv2")
         return self.get_app_input_value("adminCommunity", timeout=timeout)
 
     # ✅
-    def set_SNMPv2_contact_port(self, port: int, timeout: int = 8000):
+    def set_SNMPv2_contact_port(self, port: int, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set SNMPv2 Contact Port.
         """
-        self.click_SNMPv2()
-        self.set_app_input_value("contactPort", str(port), timeout=timeout)
+        self.set_SNMPv2_fields(contactPort=port, timeout=timeout)
 
     # ✅
-    def get_SNMPv2_contact_port(self, timeout: int = 8000) -> str:
+    def get_SNMPv2_contact_port(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv2 Contact Port.
         """
-        self.click_SNMPv2()
+        self._ensure_tab("SNMPv2")
         return self.get_app_input_value("contactPort", timeout=timeout)
 
     # ✅
-    def is_contact_port_field_valid(self, SNMP_type: str, timeout: int = 8000) -> bool:
+    def is_contact_port_field_valid(self, SNMP_type: str, timeout: int = DEFAULT_TIMEOUT_MS) -> bool:
         """
         Return True if Contact Port field is valid.
         Return False if invalid (red error state + '!' icon).
@@ -772,10 +938,10 @@ class DeviceDiscovery:
             snmp = (SNMP_type or "").strip()
 
             if snmp == "SNMPv2":
-                self.click_SNMPv2(timeout=timeout)
+                self._ensure_tab("SNMPv2", timeout=timeout)
                 scope = self.container()  # v2 fields are fine from container
             elif snmp == "SNMPv3":
-                self.click_SNMPv3(timeout=timeout)
+                self._ensure_tab("SNMPv3", timeout=timeout)
                 scope = self.active_tab_pane()  # scope to active SNMPv3 tab pane
             else:
                 raise AssertionError("SNMP_type is invalid ❌ (use 'SNMPv2' or 'SNMPv3')")
@@ -784,7 +950,7 @@ class DeviceDiscovery:
             expect(port).to_be_visible(timeout=timeout)
 
             # 1) Wrapper error class (RED FIELD)
-            wrapper = port.locator("div.input-wrapper").first
+            wrapper = port.locator(SEL_INPUT_WRAPPER).first
             sleep(3)
 
             if wrapper.count() > 0:
@@ -793,7 +959,7 @@ class DeviceDiscovery:
                     return False
 
             # 2) Invalid "!" icon
-            invalid_icon = port.locator("div.error-icon app-icon[name='input-field-invalid']").first
+            invalid_icon = port.locator(SEL_INVALID_ICON).first
             sleep(3)
 
             if invalid_icon.count() > 0:
@@ -818,26 +984,39 @@ class DeviceDiscovery:
     # ==========================================================
 
     # ✅
-    def SNMPv3_security_level_text(self, timeout: int = 8000) -> str:
+    def set_SNMPv3_fields(self, timeout: int = DEFAULT_TIMEOUT_MS, **fields):
+        """
+        Set several SNMPv3 inputs at once.
+        Keys are formcontrolnames, e.g. userName, contactPort.
+        """
+        self.set_pane_fields("SNMPv3", fields, timeout=timeout)
+
+    # ✅
+    def SNMPv3_security_level_text(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Return the current SNMPv3 Security Level selected text.
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
             return self.clean(self.dropdown_selected_text("Security Level", timeout=timeout))
         except Exception as e:
             raise AssertionError(f"_snmpv3_security_level_text failed. Problem: {e}")
     
     # ✅
-    def SNMPv3_expected_fields(self, timeout: int = 8000) -> dict:
+    def SNMPv3_expected_fields(self, timeout: int = DEFAULT_TIMEOUT_MS) -> dict:
         """
         Return which SNMPv3 fields should be visible based on the selected Security Level.
         """
         try:
-            level = self.SNMPv3_security_level_text(timeout=timeout)
+            # Known level (set by us) avoids reading the dropdown again
+            level = self._snmpv3_level if self._snmpv3_level is not None else self.SNMPv3_security_level_text(timeout=timeout)
 
             # Normalize
-            level_l = level.lower()
+            level_l = level.strip().lower()
+
+            cached = self._snmpv3_vis_cache.get(level_l)
+            if cached is not None:
+                return dict(cached)
 
             expected = {
                 "auth_protocol": False,
@@ -846,128 +1025,112 @@ class DeviceDiscovery:
                 "privacy_password": False,
             }
 
-            if level_l.lower() == "authentication, no privacy":
+            if level_l == "authentication, no privacy":
                 expected["auth_protocol"] = True
                 expected["auth_password"] = True
-                return expected
 
-            if level_l.lower() == "authentication, privacy":
+            elif level_l == "authentication, privacy":
                 expected["auth_protocol"] = True
                 expected["auth_password"] = True
                 expected["privacy_protocol"] = True
                 expected["privacy_password"] = True
-                return expected
 
-            # No Auth, No Privacy (default option)
+            # else: No Auth, No Privacy (default option)
+            self._snmpv3_vis_cache[level_l] = dict(expected)
             return expected
 
         except Exception as e:
             raise AssertionError(f"_snmpv3_expected_fields failed. Problem: {e}")
 
     # ✅
-    def SNMPv3_assert_visibility_by_security_level(self, timeout: int = 8000):
+    def SNMPv3_assert_visibility_by_security_level(self, timeout: int = DEFAULT_TIMEOUT_MS, expected: dict = None):
         """
         Assert SNMPv3 UI fields visibility matches the selected Security Level.
+        Pass expected (from SNMPv3_expected_fields) to skip re-reading the level.
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
-            expected = self.SNMPv3_expected_fields(timeout=timeout)
-
-            auth_protocol = self.page.locator("app-dropdown[label='Authentication Protocol']").first
-            auth_password = self.page.locator("app-input[formcontrolname='authenticationPassword']").first
-            privacy_protocol = self.page.locator("app-dropdown[label='Privacy Protocol']").first
-            privacy_password = self.page.locator("app-input[formcontrolname='privacyPassword']").first
-
-            # Authentication Protocol
-            if expected["auth_protocol"]:
-                expect(auth_protocol).to_be_visible(timeout=timeout)
-            else:
-                expect(auth_protocol).to_be_hidden(timeout=timeout)
-
-            # Authentication Password
-            if expected["auth_password"]:
-                expect(auth_password).to_be_visible(timeout=timeout)
-            else:
-                expect(auth_password).to_be_hidden(timeout=timeout)
-
-            # Privacy Protocol
-            if expected["privacy_protocol"]:
-                expect(privacy_protocol).to_be_visible(timeout=timeout)
-            else:
-                expect(privacy_protocol).to_be_hidden(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
+            if expected is None:
+                expected = self.SNMPv3_expected_fields(timeout=timeout)
+
+            selectors = {
+                "auth_protocol": "app-dropdown[label='Authentication Protocol']",
+                "auth_password": "app-input[formcontrolname='authenticationPassword']",
+                "privacy_protocol": "app-dropdown[label='Privacy Protocol']",
+                "privacy_password": "app-input[formcontrolname='privacyPassword']",
+            }
+            specs = [{"field": f, "selector": sel, "visible": expected[f]} for f, sel in selectors.items()]
 
-            # Privacy Password
-            if expected["privacy_password"]:
-                expect(privacy_password).to_be_visible(timeout=timeout)
-            else:
-                expect(privacy_password).to_be_hidden(timeout=timeout)
+            # One in-page poll for all four fields
+            try:
+                self.page.wait_for_function(_FIELDS_VISIBILITY_MATCH_JS, arg=specs, timeout=timeout)
+            except PlaywrightTimeoutError:
+                visible = self.page.evaluate(_FIELDS_VISIBILITY_JS, specs)
+                wrong = [f"{spec['field']} (expected {'visible' if spec['visible'] else 'hidden'})" for spec, v in zip(specs, visible) if v != spec["visible"]]
+                raise AssertionError(f"SNMPv3 fields do not match the Security Level: {wrong}")
 
         except Exception as e:
             raise AssertionError(f"_snmpv3_assert_visibility_by_security_level failed. Problem: {e}")
 
     # ✅
-    def set_SNMPv3_user_name(self, value: str, timeout: int = 8000):
+    def set_SNMPv3_user_name(self, value: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set SNMPv3 User Name.
         """
-        self.click_SNMPv3()
-        self.set_app_input_value("userName", value, timeout=timeout)
+        self.set_SNMPv3_fields(userName=value, timeout=timeout)
 
     # ✅
-    def get_SNMPv3_user_name(self, timeout: int = 8000) -> str:
+    def get_SNMPv3_user_name(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv3 User Name.
         """
-        self.click_SNMPv3()
+        self._ensure_tab("SNMPv3")
         return self.get_app_input_value("userName", timeout=timeout)
     
     # ✅
-    def set_SNMPv3_security_level(self, value: str, timeout: int = 8000):
+    def set_SNMPv3_security_level(self, value: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set SNMPv3 Security Level dropdown.
         """
-        self.click_SNMPv3(timeout=timeout)
+        self._snmpv3_level = None
+        self._ensure_tab("SNMPv3", timeout=timeout)
         self.set_dropdown_with_validation("Security Level", value, timeout=timeout)
+        self._snmpv3_level = value
 
     # ✅
-    def get_SNMPv3_security_level(self, timeout: int = 8000) -> str:
+    def get_SNMPv3_security_level(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv3 Security Level dropdown value.
         """
-        self.click_SNMPv3(timeout=timeout)
+        self._ensure_tab("SNMPv3", timeout=timeout)
         return self.dropdown_selected_text("Security Level", timeout=timeout)
 
     # ✅
-    def set_SNMPv3_contact_port(self, port: int, timeout: int = 8000):
+    def set_SNMPv3_contact_port(self, port: int, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set SNMPv3 Contact Port.
         """
-        self.click_SNMPv3(timeout=timeout)
-        pane = self.active_tab_pane()
-        self.set_app_input_value("contactPort", str(port), timeout=timeout, scope=pane)
+        self.set_SNMPv3_fields(contactPort=port, timeout=timeout)
 
     # ✅
-    def get_SNMPv3_contact_port(self, timeout: int = 8000) -> str:
+    def get_SNMPv3_contact_port(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv3 Contact Port.
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
             pane = self.active_tab_pane()
             return self.get_app_input_value("contactPort", timeout=timeout, scope=pane)
         except Exception as e:
             raise AssertionError(f"get_SNMPv3_contact_port failed. Problem: {e}")
 
     # ✅
-    def set_SNMPv3_authentication_protocol(self, value: str, timeout: int = 8000):
+    def set_SNMPv3_authentication_protocol(self, value: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set SNMPv3 Authentication Protocol dropdown.
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
-
-            dropdown = self.app_dropdown("Authentication Protocol")
-            expect(dropdown).to_be_visible(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
 
             self.set_dropdown_with_validation("Authentication Protocol", value, timeout=timeout)
 
@@ -975,15 +1138,12 @@ class DeviceDiscovery:
             raise AssertionError(f"set_SNMPv3_authentication_protocol('{value}') failed. Problem: {e}")
 
     # ✅
-    def get_SNMPv3_authentication_protocol(self, timeout: int = 8000) -> str:
+    def get_SNMPv3_authentication_protocol(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv3 Authentication Protocol value.
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
-
-            dropdown = self.app_dropdown("Authentication Protocol")
-            expect(dropdown).to_be_visible(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
 
             return self.dropdown_selected_text("Authentication Protocol", timeout=timeout)
 
@@ -991,49 +1151,43 @@ class DeviceDiscovery:
             raise AssertionError(f"get_SNMPv3_authentication_protocol failed. Problem: {e}")
 
     # ✅
-    def set_SNMPv3_authentication_password(self, password: str, timeout: int = 8000):
+    def set_SNMPv3_authentication_password(self, password: str, timeout: int = DEFAULT_TIMEOUT_MS, use_keystrokes: bool = False):
         """
         Set SNMPv3 Authentication Password.
+        use_keystrokes=True types it key by key instead of a single fill().
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
 
             inp = self.app_input_field("authenticationPassword")
-            expect(inp).to_be_visible(timeout=timeout)
 
-            inp.click(force=True)
-            inp.fill("")
-            inp.type(str(password), delay=5)
+            self.fill_input(inp, password, timeout=timeout, use_keystrokes=use_keystrokes)
 
         except Exception as e:
             raise AssertionError(f"set_SNMPv3_authentication_password failed. Problem: {e}")
 
     # ✅
-    def get_SNMPv3_authentication_password(self, timeout: int = 8000) -> str:
+    def get_SNMPv3_authentication_password(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv3 Authentication Password value.
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
 
             inp = self.app_input_field("authenticationPassword")
-            expect(inp).to_be_visible(timeout=timeout)
 
-            return self.clean(inp.input_value())
+            return self.clean(inp.input_value(timeout=timeout))
 
         except Exception as e:
             raise AssertionError(f"get_SNMPv3_authentication_password failed. Problem: {e}")
 
     # ✅
-    def set_SNMPv3_privacy_protocol(self, value: str, timeout: int = 8000):
+    def set_SNMPv3_privacy_protocol(self, value: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set SNMPv3 Privacy Protocol dropdown.
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
-
-            dropdown = self.app_dropdown("Privacy Protocol")
-            expect(dropdown).to_be_visible(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
 
             self.set_dropdown_with_validation("Privacy Protocol", value, timeout=timeout)
 
@@ -1041,15 +1195,12 @@ class DeviceDiscovery:
             raise AssertionError(f"set_SNMPv3_privacy_protocol('{value}') failed. Problem: {e}")
 
     # ✅
-    def get_SNMPv3_privacy_protocol(self, timeout: int = 8000) -> str:
+    def get_SNMPv3_privacy_protocol(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv3 Privacy Protocol value.
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
-
-            dropdown = self.app_dropdown("Privacy Protocol")
-            expect(dropdown).to_be_visible(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
 
             return self.dropdown_selected_text("Privacy Protocol", timeout=timeout)
 
@@ -1057,42 +1208,39 @@ class DeviceDiscovery:
             raise AssertionError(f"get_SNMPv3_privacy_protocol failed. Problem: {e}")
 
     # ✅
-    def set_SNMPv3_privacy_password(self, password: str, timeout: int = 8000):
+    def set_SNMPv3_privacy_password(self, password: str, timeout: int = DEFAULT_TIMEOUT_MS, use_keystrokes: bool = False):
         """
         Set SNMPv3 Privacy Password.
+        use_keystrokes=True types it key by key instead of a single fill().
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
 
             inp = self.app_input_field("privacyPassword")
-            expect(inp).to_be_visible(timeout=timeout)
 
-            inp.click(force=True)
-            inp.fill("")
-            inp.type(str(password), delay=5)
+            self.fill_input(inp, password, timeout=timeout, use_keystrokes=use_keystrokes)
 
         except Exception as e:
             raise AssertionError(f"set_SNMPv3_privacy_password failed. Problem: {e}")
 
     # ✅
-    def get_SNMPv3_privacy_password(self, timeout: int = 8000) -> str:
+    def get_SNMPv3_privacy_password(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get SNMPv3 Privacy Password value.
         """
         try:
-            self.click_SNMPv3(timeout=timeout)
+            self._ensure_tab("SNMPv3", timeout=timeout)
 
             inp = self.app_input_field("privacyPassword")
-            expect(inp).to_be_visible(timeout=timeout)
 
-            return self.clean(inp.input_value())
+            return self.clean(inp.input_value(timeout=timeout))
 
         except Exception as e:
             raise AssertionError(f"get_SNMPv3_privacy_password failed. Problem: {e}")
 
     # ✅
     def configure_SNMPv3_entire_process(self, security_level: str, auth_protocol: str = None, auth_password: str = None,
-        privacy_protocol: str = None, privacy_password: str = None, timeout: int = 8000):
+        privacy_protocol: str = None, privacy_password: str = None, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Configure SNMPv3 settings safely based on the requested Security Level.
         """
@@ -1101,34 +1249,25 @@ class DeviceDiscovery:
             self.set_SNMPv3_security_level(security_level, timeout=timeout)
 
             # 2) Validate UI state matches the selected level
-            self.SNMPv3_assert_visibility_by_security_level(timeout=timeout)
-
             expected = self.SNMPv3_expected_fields(timeout=timeout)
+            self.SNMPv3_assert_visibility_by_security_level(timeout=timeout, expected=expected)
+
+            # 3) Level-dependent fields (only if expected), in UI order
+            values = {
+                "auth_protocol": auth_protocol,
+                "auth_password": auth_password,
+                "privacy_protocol": privacy_protocol,
+                "privacy_password": privacy_password,
+            }
+            for key, setter_suffix in SNMPV3_LEVEL_FIELDS:
+                if not expected[key]:
+                    continue
+                if values[key] is None:
+                    raise AssertionError(f"configure_SNMPv3: {key} is required for this Security Level.")
+                getattr(self, f"set_SNMPv3_{setter_suffix}")(values[key], timeout=timeout)
 
-            # 3) Authentication fields (only if expected)
-            if expected["auth_protocol"]:
-                if auth_protocol is None:
-                    raise AssertionError("configure_SNMPv3: auth_protocol is required for this Security Level.")
-                self.set_SNMPv3_authentication_protocol(auth_protocol, timeout=timeout)
-
-            if expected["auth_password"]:
-                if auth_password is None:
-                    raise AssertionError("configure_SNMPv3: auth_password is required for this Security Level.")
-                self.set_SNMPv3_authentication_password(auth_password, timeout=timeout)
-
-            # 4) Privacy fields (only if expected)
-            if expected["privacy_protocol"]:
-                if privacy_protocol is None:
-                    raise AssertionError("configure_SNMPv3: privacy_protocol is required for this Security Level.")
-                self.set_SNMPv3_privacy_protocol(privacy_protocol, timeout=timeout)
-
-            if expected["privacy_password"]:
-                if privacy_password is None:
-                    raise AssertionError("configure_SNMPv3: privacy_password is required for this Security Level.")
-                self.set_SNMPv3_privacy_password(privacy_password, timeout=timeout)
-
-            # 5) Final sanity check: UI still matches the level
-            self.SNMPv3_assert_visibility_by_security_level(timeout=timeout)
+            # No final visibility re-check: only the Security Level drives which fields are shown,
+            # and it was already asserted in step 2 (the protocol/password setters cannot change it).
 
         except Exception as e:
             raise AssertionError(f"configure_SNMPv3 failed. Problem: {e}")
@@ -1138,14 +1277,14 @@ class DeviceDiscovery:
     # ==========================================================
 
     # ✅
-    def set_performance_transport_protocol(self, value: str, timeout: int = 8000):
+    def set_performance_transport_protocol(self, value: str, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Set Performance Transport Protocol dropdown.
         """
         self.set_dropdown_with_validation("Performance Transport Protocol", value, timeout=timeout)
 
     # ✅
-    def get_performance_transport_protocol(self, timeout: int = 8000) -> str:
+    def get_performance_transport_protocol(self, timeout: int = DEFAULT_TIMEOUT_MS) -> str:
         """
         Get Performance Transport Protocol dropdown value.
         """
@@ -1160,60 +1299,66 @@ class DeviceDiscovery:
         """
         Return Reset to Default button.
         """
-        return self.footer().locator("button.btn.simple-btn", has_text=re.compile(r"^\s*Reset to Default\s*$")).first
+        if "reset" not in self._loc_cache:
+            self._loc_cache["reset"] = self.footer().get_by_role("button", name="Reset to Default", exact=True).first
+        return self._loc_cache["reset"]
 
     # ✅
     def save_as_default_btn(self):
         """
         Return Save as Default button.
         """
-        return self.footer().locator("button.btn.simple-btn.with-icon-btn", has_text=re.compile(r"^\s*Save as Default\s*$")).first
+        if "save" not in self._loc_cache:
+            self._loc_cache["save"] = self.footer().get_by_role("button", name="Save as Default").first  # not exact: button also holds an icon
+        return self._loc_cache["save"]
 
     # ✅
     def start_discovery_btn(self):
         """
         Return Start Discovery button.
         """
-        return self.footer().locator("button.btn.btn-primary.default-btn", has_text=re.compile(r"^\s*Start Discovery\s*$")).first
+        if "start" not in self._loc_cache:
+            self._loc_cache["start"] = self.footer().get_by_role("button", name="Start Discovery", exact=True).first
+        return self._loc_cache["start"]
 
     # ✅
     def default_override_modal(self):
         """
         Return the 'Confirm default override' modal dialog.
         """
-        modal = self.page.locator("div.modal-dialog.pl-modal").filter(has=self.page.locator("div.title", has_text=re.compile(r"^\s*Confirm default override\s*$"))).first
-        return modal
+        if "override_modal" not in self._loc_cache:
+            self._loc_cache["override_modal"] = self.page.locator("div.modal-dialog.pl-modal").filter(has=self.page.locator("div.title", has_text="Confirm default override")).first
+        return self._loc_cache["override_modal"]
 
     # ✅
     def default_override_yes_btn(self):
         """
         Return the Yes button in the default override modal.
         """
-        modal = self.default_override_modal()
-        return modal.locator("div.actions button", has_text=re.compile(r"^\s*Yes\s*$")).first
+        if "override_yes" not in self._loc_cache:
+            self._loc_cache["override_yes"] = self.default_override_modal().get_by_role("button", name="Yes", exact=True).first
+        return self._loc_cache["override_yes"]
 
     # ✅
     def default_override_no_btn(self):
         """
         Return the No button in the default override modal.
         """
-        modal = self.default_override_modal()
-        return modal.locator("div.actions button", has_text=re.compile(r"^\s*No\s*$")).first
+        if "override_no" not in self._loc_cache:
+            self._loc_cache["override_no"] = self.default_override_modal().get_by_role("button", name="No", exact=True).first
+        return self._loc_cache["override_no"]
 
     # ✅
-    def click_button_and_validate_toast(self, success_text: str, failure_label: str, timeout: int = 8000) -> bool:
+    def click_button_and_validate_toast(self, success_text: str, failure_label: str, timeout: int = SUCCESS_TIMEOUT_MS) -> bool:
         """
         Click action validation using toast + overlay wrapper visibility.
         """
         try:
-            toast = self.page.locator(f"text={success_text}")
+            toast = self.page.get_by_text(success_text)
             expect(toast).to_be_visible(timeout=timeout)
 
+            # Toast lives inside the overlay wrapper: overlay hidden => toast gone too
             overlay = self.page.locator("div.cdk-global-overlay-wrapper").first
-            expect(overlay).to_be_visible(timeout=timeout)
-
-            # wait toast disappear + overlay disappear
-            expect(toast).to_be_hidden(timeout=timeout)
             expect(overlay).to_be_hidden(timeout=timeout)
 
             return True
@@ -1222,84 +1367,71 @@ class DeviceDiscovery:
             raise AssertionError(f"{failure_label} failed. Problem: {e}")
 
     # ✅
-    def click_reset_to_default(self, timeout: int = 8000):
+    def click_reset_to_default(self, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Click Reset to Default button.
         """
         try:
-            btn = self.reset_to_default_btn()
-            expect(btn).to_be_visible(timeout=timeout)
-            btn.click(force=True)
+            self.reset_to_default_btn().click(timeout=timeout)
             countdown_sleep(10, "Waiting that device discovery will reset to default")
             refresh_page(self.page)
+            self.invalidate_cache()
+
         except Exception as e:
             raise AssertionError(f"click_reset_to_default failed. Problem: {e}")
 
     # ✅
-    def click_save_as_default(self, timeout: int = 8000):
+    def click_save_as_default(self, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Click Save as Default button.
         """
         try:
-            btn = self.save_as_default_btn()
-            expect(btn).to_be_visible(timeout=timeout)
-            btn.click(force=True)
+            self.save_as_default_btn().click(timeout=timeout)
+
         except Exception as e:
             raise AssertionError(f"click_save_as_default failed. Problem: {e}")
 
     # ✅
-    def confirm_default_override(self, timeout: int = 8000):
+    def confirm_default_override(self, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Click Yes on the default override confirmation modal that comes
         after the 'Save as Default' button.
         """
         try:
-            modal = self.default_override_modal()
-            self.wait_until(lambda: modal.count() > 0 and modal.is_visible(), timeout_ms=timeout, interval_ms=200)
-
+            # click() waits for the modal's button; the button going away means the modal closed
             yes_btn = self.default_override_yes_btn()
-            expect(yes_btn).to_be_visible(timeout=timeout)
-            yes_btn.click(force=True)
-
-            # wait modal to close
-            self.wait_until(lambda: modal.count() == 0 or (not modal.is_visible()), timeout_ms=timeout, interval_ms=200)
+            yes_btn.click(timeout=timeout)
+            expect(yes_btn).to_be_hidden(timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"confirm_default_override failed. Problem: {e}")
 
     # ✅
-    def reject_default_override(self, timeout: int = 8000):
+    def reject_default_override(self, timeout: int = DEFAULT_TIMEOUT_MS):
         """
         Click No on the default override confirmation modal that comes
         after the 'Save as Default' button.
         """
         try:
-            modal = self.default_override_modal()
-            self.wait_until(lambda: modal.count() > 0 and modal.is_visible(), timeout_ms=timeout, interval_ms=200)
-
+            # click() waits for the modal's button; the button going away means the modal closed
             no_btn = self.default_override_no_btn()
-            expect(no_btn).to_be_visible(timeout=timeout)
-            no_btn.click(force=True)
-
-            # wait modal to close
-            self.wait_until(lambda: modal.count() == 0 or (not modal.is_visible()), timeout_ms=timeout, interval_ms=200)
+            no_btn.click(timeout=timeout)
+            expect(no_btn).to_be_hidden(timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"reject_default_override failed. Problem: {e}")
 
     # ✅
-    def click_start_discovery(self, timeout: int = 8000, is_icmp: bool = False) -> bool:
+    def click_start_discovery(self, timeout: int = SUCCESS_TIMEOUT_MS, is_icmp: bool = False) -> bool:
         """
         Click Start Discovery and verify that the action succeeded.
         """
         try:
+            # Form validation may briefly keep the button disabled - wait it out instead of failing at once
             btn = self.start_discovery_btn()
-            expect(btn).to_be_visible(timeout=timeout)
-
-            if btn.get_attribute("disabled") is not None:
-                raise AssertionError("Start Discovery button is disabled.")
+            expect(btn).to_be_enabled(timeout=timeout)
 
-            btn.click(force=True)
+            btn.click(timeout=timeout)
 
             # Verify success message
             if is_icmp:
@@ -1313,7 +1445,7 @@ class DeviceDiscovery:
             raise AssertionError(f"click_start_discovery failed. Problem: {e}")
 
     # ✅
-    def is_start_discovery_btn_enabled(self, timeout: int = 8000) -> bool:
+    def is_start_discovery_btn_enabled(self, timeout: int = DEFAULT_TIMEOUT_MS) -> bool:
         """
         Return True if Start Discovery button is enabled.
         Return False if disabled.
@@ -1343,25 +1475,13 @@ class DeviceDiscovery:
         Close the Device Discovery container using the X icon.
         """
         try:
-            x = self.close_btn()
-            expect(x).to_be_visible(timeout=timeout)
-
-            inner = x.locator("i").first
-            if inner.count() > 0:
-                inner.click(force=True)
-            else:
-                x.click(force=True)
+            # Click on app-icon reaches its inner <i> as well - no need to probe for it
+            self.close_btn().click(timeout=timeout)
 
             # Wait container to disappear/hide
-            cont = self.page.locator("div.device-discovery-container").first
-
-            def closed():
-                try:
-                    return cont.count() == 0 or (not cont.is_visible())
-                except Exception:
-                    return True
-
-            self.wait_until(closed, timeout_ms=timeout, interval_ms=200)
+            cont = self.page.locator(SEL_CONTAINER).first
+            expect(cont).to_be_hidden(timeout=timeout)
+            self.invalidate_cache()
 
         except Exception as e:
-            raise AssertionError(f"close_device_discovery failed. Problem: {e}")
\ No newline at end of file
+            raise AssertionError(f"close_device_discovery failed. Problem: {e}")
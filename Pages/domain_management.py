@@ -7,14 +7,119 @@ from __future__ import annotations
 import re
 import time
 import random
+import functools
 from typing import Callable, Optional, Any
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Page, expect, TimeoutError as PlaywrightTimeoutError
 from time import sleep
 from Utils.utils import refresh_page, countdown_sleep
 
 
 RENDER_WAIT_TIME = 15
 
+SEL_TREE = "section.domain-management-container app-inventory-tree"
+
+# Title rows of every device type (DEVICE / ROADM / TRANSPONDER / MUXPONDER)
+_DEVICE_ROWS_SELECTOR = "div.inventory-tree-level-title:is([type='DEVICE'], [type='ROADM'], [type='TRANSPONDER'], [type='MUXPONDER'])"
+
+# Constant patterns used by the locators below (compiled once at import)
+_RX_FROM_TITLE = re.compile(r"^\s*From\s*$")
+_RX_TO_TITLE = re.compile(r"^\s*To\s*$")
+_RX_ADD_NEW_DOMAIN_TITLE = re.compile(r"^\s*Add new domain\s*$")
+_RX_WARNING_TITLE = re.compile(r"^\s*Warning\s*$")
+_RX_MESSAGE_TITLE = re.compile(r"^\s*Message\s*$")
+_RX_RENAME_CHASSIS_TITLE = re.compile(r"^\s*Rename chassis\s*$")
+_RX_CHANGE_CHASSIS_TITLE = re.compile(r"^\s*Changing chassis ID for\s+.+\s*$", re.IGNORECASE)
+_RX_ADD_DOMAIN_TOAST = re.compile(r"\bAdd domain\b", re.IGNORECASE)
+_RX_ADD_DOMAIN_ERROR_H1 = re.compile(r"^\s*Some problems with adding Domain\s*$", re.IGNORECASE)
+_RX_GO_BACK = re.compile(r"^\s*Go to Back\s*$")
+_RX_NEXT = re.compile(r"^\s*Next\s*$")
+_RX_PREVIOUS = re.compile(r"^\s*Previous\s*$", re.IGNORECASE)
+_RX_SAVE = re.compile(r"^\s*Save\s*$", re.IGNORECASE)
+_RX_CHECKED = re.compile(r"\bchecked\b")
+_RX_IPV4 = re.compile(r"\d{1,3}(?:\.\d{1,3}){3}")
+_RX_IPV4_IN_PARENS = re.compile(r"\(\s*\d{1,3}(?:\.\d{1,3}){3}\s*\)")
+
+
+# Expander arrows of a tree row in one round-trip: {up, down} -> visible / hidden, or null when missing
+_ROW_ARROWS_JS = """
+row => {
+    const vis = e => e ? !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length) : null;
+    return {
+        up: vis(row.querySelector("app-icon[name='arrow-up']")),
+        down: vis(row.querySelector("app-icon[name='arrow-down']")),
+    };
+}
+"""
+
+# Whitespace-normalized text of every matched tree row in one round-trip
+_ROW_TITLES_JS = "els => els.map(e => (e.textContent || '').replace(/\\s+/g, ' ').trim())"
+
+# True when the tree row is already the selected one
+_ROW_IS_CURRENT_JS = "el => el.classList.contains('current')"
+
+# Collapse container state in one round-trip
+_COLLAPSE_STATE_JS = """
+el => ({
+    ah: (el.getAttribute('aria-hidden') || '').trim().toLowerCase(),
+    st: (el.getAttribute('style') || '').toLowerCase(),
+    cl: el.className || '',
+})
+"""
+
+# Expand-completion predicates, evaluated in-page by wait_for_function
+_ROW_EXPANDED_JS = f"row => {{ const a = ({_ROW_ARROWS_JS})(row); return !!a.up || a.down === false; }}"
+_COLLAPSE_EXPANDED_JS = f"el => {{ const s = ({_COLLAPSE_STATE_JS})(el); return s.ah === 'false' || s.st.includes('display: block') || s.cl.includes('show'); }}"
+
+# Tree title row -> collapse container of its own tree level (replaces the xpath ancestor walk)
+_ROW_COLLAPSE_JS = "row => { const lvl = row.closest('app-inventory-tree-level'); return lvl ? lvl.querySelector('div.collapse') : null; }"
+_ROW_COLLAPSE_STATE_JS = f"row => {{ const c = ({_ROW_COLLAPSE_JS})(row); return c ? ({_COLLAPSE_STATE_JS})(c) : null; }}"
+_ROW_COLLAPSE_EXPANDED_JS = f"row => {{ const c = ({_ROW_COLLAPSE_JS})(row); return !!c && ({_COLLAPSE_EXPANDED_JS})(c); }}"
+
+
+# Single-pass escape table for tree names: regex metachars are escaped, and
+# "/" tolerates surrounding spaces ("DC-14/14" == "DC-14 / 14"), '-' also matches '–', spaces match any whitespace run
+_NAV_TEXT_TABLE = str.maketrans({
+    **{c: "\\" + c for c in ".^$*+?()[]{}|\\"},
+    "/": r"\s*/\s*",
+    "-": r"[-–]",
+    " ": r"\s+",
+})
+
+
+@functools.lru_cache(maxsize=2048)
+def _nav_text_regex(s: str) -> re.Pattern:
+    """
+    Flexible tree-name regex (spacing / dash variants), compiled once per name.
+    """
+    return re.compile(s.translate(_NAV_TEXT_TABLE))
+
+
+@functools.lru_cache(maxsize=128)
+def _exact_regex(text: str) -> re.Pattern:
+    """
+    Full-text match (surrounding whitespace ignored), compiled once per text.
+    """
+    return re.compile(rf"^\s*{re.escape(text)}\s*$")
+
+
+@functools.lru_cache(maxsize=128)
+def _device_ip_regex(ip: str, parens_only: bool = False) -> re.Pattern:
+    """
+    Device-row match by IP: "(IP)" inside "NAME (IP)", or (unless parens_only) a bare IP row.
+    Compiled once per IP.
+    """
+    if parens_only:
+        return re.compile(rf"\(\s*{re.escape(ip)}\s*\)")
+    return re.compile(rf"(^|\()\s*{re.escape(ip)}\s*(\)|$)")
+
+
+@functools.lru_cache(maxsize=128)
+def _word_regex_ci(text: str) -> re.Pattern:
+    """
+    Case-insensitive whole-word match, compiled once per text.
+    """
+    return re.compile(rf"\b{re.escape(text)}\b", re.IGNORECASE)
+
 
 class DomainManagement:
     """
@@ -24,6 +129,37 @@ class DomainManagement:
 
     def __init__(self, page: Page):
         self.page = page
+        self._loc_cache = {}
+        self._current_modal = None      # modal opened by the running flow (see modal())
+
+        # Cached locators belong to the previous document - drop them on navigation/refresh
+        self.page.on("framenavigated", self._on_frame_navigated)
+
+    # ✅
+    def _on_frame_navigated(self, frame):
+        """
+        framenavigated listener: invalidate caches when the main frame navigates.
+        """
+        if frame == self.page.main_frame:
+            self.invalidate_cache()
+
+    # ✅
+    def invalidate_cache(self):
+        """
+        Drop all cached locators.
+        Runs automatically on main-frame navigation (e.g. refresh_page).
+        """
+        self._loc_cache = {}
+        self._current_modal = None
+
+    # ✅
+    def _cached(self, key: str, build: Callable[[], Any]):
+        """
+        Return the cached locator for key, building it on first use.
+        """
+        if key not in self._loc_cache:
+            self._loc_cache[key] = build()
+        return self._loc_cache[key]
 
     # ==========================================================
     # Generic helpers
@@ -35,10 +171,11 @@ class DomainManagement:
         Polls condition() until it returns True or timeout.
         Raises AssertionError on timeout.
         """
-        end_time = time.time() + (timeout_ms / 1000.0)
+        deadline_ns = time.monotonic_ns() + timeout_ms * 1_000_000
+        interval_s = interval_ms / 1000.0
         last_exc = None
 
-        while time.time() < end_time:
+        while time.monotonic_ns() < deadline_ns:
             try:
                 if condition():
                     return
@@ -46,36 +183,42 @@ class DomainManagement:
             except Exception as e:
                 last_exc = e
 
-            time.sleep(interval_ms / 1000.0)
+            time.sleep(interval_s)
 
         if last_exc:
             raise AssertionError(f"Condition not met within {timeout_ms}ms. Last error: {last_exc}")
         raise AssertionError(f"Condition not met within {timeout_ms}ms.")
 
     # ✅
-    def wait_until(self, condition: Callable[[], bool], timeout_ms: int = 10_000, interval_ms: int = 200, *, desc: str = "condition",
-        allow_exceptions: tuple[type[BaseException], ...] = (Exception,), stable_successes: int = 1, on_timeout: Optional[Callable[[], Any]] = None):
+    def wait_until(self, condition: Callable[[], bool], timeout_ms: int = 10_000, interval_ms: Optional[int] = None, *, desc: str = "condition",
+        allow_exceptions: tuple[type[BaseException], ...] = (Exception,), stable_successes: int = 1, on_timeout: Optional[Callable[[], Any]] = None,
+        min_interval_ms: int = 20, max_interval_ms: int = 200):
         """
         Polls condition() until it returns True or timeout.
+        The poll interval backs off exponentially from min_interval_ms to max_interval_ms
+        (interval_ms, if given, is treated as max_interval_ms).
         Raises AssertionError on timeout.
         """
+        if interval_ms is not None:
+            max_interval_ms = interval_ms
         if timeout_ms <= 0:
             raise ValueError("timeout_ms must be > 0")
-        if interval_ms <= 0:
-            raise ValueError("interval_ms must be > 0")
+        if min_interval_ms <= 0 or max_interval_ms <= 0:
+            raise ValueError("poll intervals must be > 0")
+        min_interval_ms = min(min_interval_ms, max_interval_ms)
         if stable_successes <= 0:
             raise ValueError("stable_successes must be >= 1")
 
-        start = time.perf_counter()
-        deadline = start + (timeout_ms / 1000.0)
+        start_ns = time.monotonic_ns()
+        deadline_ns = start_ns + timeout_ms * 1_000_000
 
         attempts = 0
         last_exc: Optional[BaseException] = None
         consecutive = 0
+        cur_interval_ms = min_interval_ms
 
         while True:
-            now = time.perf_counter()
-            if now >= deadline:
+            if time.monotonic_ns() >= deadline_ns:
                 break
 
             attempts += 1
@@ -95,8 +238,8 @@ class DomainManagement:
                 consecutive = 0
 
             # sleep with jitter, but never past deadline
-            remaining_s = max(0.0, deadline - time.perf_counter())
-            base_sleep_s = interval_ms / 1000.0
+            remaining_s = max(0, deadline_ns - time.monotonic_ns()) / 1e9
+            base_sleep_s = cur_interval_ms / 1000.0
             jitter_s = random.uniform(0.0, min(0.05, base_sleep_s * 0.25))  # up to 50ms or 25%
             sleep_s = min(remaining_s, base_sleep_s + jitter_s)
 
@@ -104,6 +247,9 @@ class DomainManagement:
                 break
             time.sleep(sleep_s)
 
+            # back off: 20 -> 40 -> 80 -> 160 -> 200ms (default bounds)
+            cur_interval_ms = min(max_interval_ms, cur_interval_ms * 2)
+
         # Collect extra debug on timeout (optional)
         extra = ""
         if on_timeout:
@@ -114,7 +260,7 @@ class DomainManagement:
             except Exception as e:
                 extra = f"\nExtra debug failed: {e}"
 
-        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        elapsed_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
         if last_exc:
             raise AssertionError(
@@ -124,92 +270,114 @@ class DomainManagement:
             )
         raise AssertionError(f"wait_until timeout after {elapsed_ms}ms waiting for {desc}. Attempts={attempts}.{extra}")
 
+    # ✅
+    def wait_for_element_state(self, target, predicate_js: str, timeout: int = 5000, desc: str = "element state"):
+        """
+        Wait until predicate_js(element) is truthy for the element behind target.
+        The predicate runs inside the browser (wait_for_function), so there is no Python-side polling.
+        Raises AssertionError on timeout.
+        """
+        handle = target.element_handle(timeout=timeout)
+        try:
+            self.page.wait_for_function(predicate_js, arg=handle, timeout=timeout)
+        except PlaywrightTimeoutError:
+            raise AssertionError(f"Timed out after {timeout}ms waiting for {desc}.")
+        finally:
+            handle.dispose()
+
     # ✅
     def root(self):
         """
         Return the main Domain Management page container.
         """
-        return self.page.locator("app-device-management, section.domain-management-container").first
+        return self._cached("root", lambda: self.page.locator("app-device-management, section.domain-management-container").first)
 
     # ✅
     def tree_container(self):
         """
         Return the inventory tree container element.
         """
-        return self.page.locator("section.domain-management-container app-inventory-tree").first
+        return self._cached("tree_container", lambda: self.page.locator(SEL_TREE).first)
 
     # ✅
     def tree_by_title(self, title: str):
         """
         Return the inventory tree with the given title.
         """
-        return self.page.locator("section.domain-management-container app-inventory-tree").filter(has=self.page.locator("h3", has_text=re.compile(rf"^\s*{re.escape(title)}\s*$"))).first
+        return self._cached(f"tree:{title}", lambda: self._tree_with_title(_exact_regex(title)))
+
+    # ✅
+    def _tree_with_title(self, title_rx: re.Pattern):
+        """
+        Build the inventory tree locator whose h3 title matches title_rx.
+        """
+        return self.page.locator(SEL_TREE).filter(has=self.page.locator("h3", has_text=title_rx)).first
 
     # ✅
     def from_tree(self):
         """
         Return the 'From' inventory tree.
         """
-        return self.tree_by_title("From")
+        return self._cached("tree:From", lambda: self._tree_with_title(_RX_FROM_TITLE))
 
     # ✅
     def to_tree(self):
         """
         Return the 'To' inventory tree.
         """
-        return self.tree_by_title("To")
+        return self._cached("tree:To", lambda: self._tree_with_title(_RX_TO_TITLE))
 
     # ✅
     def bottom_actions(self):
         """
         Return the bottom action buttons container('Add domain', 'Remove', 'Rename', 'Change Chassis ID', 'Move to domain').
         """
-        bottom_actions = self.page.locator("section.domain-management-bottom-actions").first
-        sleep(1)
-        
-        return bottom_actions
+        return self._cached("bottom_actions", lambda: self.page.locator("section.domain-management-bottom-actions").first)
 
     # ✅
     def action_btn(self, text: str):
         """
         Return a bottom action button by its visible text.
         """
-        bottom_action_button = self.bottom_actions().locator("button.btn", has_text=re.compile(rf"^\s*{re.escape(text)}\s*$")).first
-        sleep(1)
-
-        return bottom_action_button
+        return self._cached(f"action:{text}", lambda: self.bottom_actions().locator("button.btn", has_text=_exact_regex(text)).first)
 
     # ✅
     def nav_text_regex(self, element_name: str) -> re.Pattern:
         """
         Create a flexible regex to match tree item names despite spacing or symbol differences.
         """
-        s = element_name.strip()
-
-        esc = re.escape(s)
-
-        # Allow spaces around slashes: "DC-14/14" == "DC-14 / 14"
-        esc = esc.replace(r"\/", r"\s*/\s*")
-
-        # Treat '-' and '–' as equivalent in UI text
-        esc = esc.replace(r"\-", r"[-–]")
-
-        # Collapse any escaped spaces into flexible whitespace
-        esc = esc.replace(r"\ ", r"\s+")
-
-        return re.compile(esc)
+        return _nav_text_regex(element_name.strip())
 
     # ✅
     def row_locator(self, name: str, tree_title: str = "From"):
         """
         Locate a tree row by name inside the specified tree.
         """
-        rx = self.nav_text_regex(name)
         tree = self.from_tree() if tree_title == "From" else self.to_tree()
-        row_locator = tree.locator("div.inventory-tree-level-title", has_text=rx).first
-        sleep(0.5)
+        return self._cached(f"row:{tree_title}:{name}", lambda: self._row_in(tree, name))
+
+    # ✅
+    def _row_in(self, tree, name: str):
+        """
+        Locate a tree row by name inside an already resolved tree locator (no settle delay - safe inside polls).
+        """
+        return tree.locator("div.inventory-tree-level-title", has_text=self.nav_text_regex(name)).first
+
+    # ✅
+    def _row_titles(self, tree_title: str = "From") -> list[str]:
+        """
+        Snapshot the text of every row in the tree (single evaluate_all round-trip).
+        """
+        tree = self.from_tree() if tree_title == "From" else self.to_tree()
+        return tree.locator("div.inventory-tree-level-title").evaluate_all(_ROW_TITLES_JS)
 
-        return row_locator
+    # ✅
+    def _has_row(self, name: str, tree_title: str = "From") -> bool:
+        """
+        True if any row in the tree matches name (matched Python-side on a _row_titles snapshot).
+        """
+        rx = self.nav_text_regex(name)
+        return any(rx.search(t) for t in self._row_titles(tree_title))
 
     # ✅
     def select_row(self, name: str, tree_title: str = "From", timeout: int = 5000):
@@ -217,6 +385,11 @@ class DomainManagement:
         Click a tree row.
         """
         row = self.row_locator(name, tree_title=tree_title)
+        try:
+            if row.evaluate(_ROW_IS_CURRENT_JS, timeout=timeout):
+                return  # already selected - clicking again can toggle it off
+        except PlaywrightTimeoutError:
+            pass  # row missing - let click_row_and_wait report it
         self.click_row_and_wait(row, timeout=timeout, wait_for="any_action", desc=f"any action enabled after selecting '{name}'")
 
     # ✅
@@ -224,12 +397,9 @@ class DomainManagement:
         """
         Locate a DOMAIN-type row (used to enable Add domain).
         """
-        rx = self.nav_text_regex(name)
         tree = self.from_tree() if tree_title == "From" else self.to_tree()
-        row_locator = tree.locator("div.inventory-tree-level-title[type='DOMAIN']", has_text=rx).first
-        sleep(0.5)
-
-        return row_locator 
+        return self._cached(f"domain_row:{tree_title}:{name}",
+                            lambda: tree.locator("div.inventory-tree-level-title[type='DOMAIN']", has_text=self.nav_text_regex(name)).first)
 
     # ✅
     def chassis_row_locator(self, name: str, tree_title: str = "From"):
@@ -262,18 +432,17 @@ class DomainManagement:
             raise ValueError("device_name_or_ip is empty")
 
         tree = self.from_tree() if tree_title == "From" else self.to_tree()
-        device_types = ("DEVICE", "ROADM", "TRANSPONDER", "MUXPONDER")
 
         # If user passed only IP -> match "(IP)"
-        is_ip_only = re.fullmatch(r"\d{1,3}(?:\.\d{1,3}){3}", target) is not None
+        is_ip_only = _RX_IPV4.fullmatch(target) is not None
         if is_ip_only:
             # rx = re.compile(rf"\(\s*{re.escape(target)}\s*\)")
-            rx = re.compile(rf"(^|\()\s*{re.escape(target)}\s*(\)|$)")
+            rx = _device_ip_regex(target)
         else:
             # Prefer your flexible matcher for "NAME (IP)"
             rx = self.nav_text_regex(target)
 
-        rows = tree.locator(", ".join([f"div.inventory-tree-level-title[type='{t}']" for t in device_types]))
+        rows = tree.locator(_DEVICE_ROWS_SELECTOR)
         sleep(0.5)
 
         return rows.filter(has_text=rx).first
@@ -284,6 +453,11 @@ class DomainManagement:
         Select a DOMAIN row.
         """
         row = self.domain_row_locator(name, tree_title=tree_title)
+        try:
+            if row.evaluate(_ROW_IS_CURRENT_JS, timeout=timeout):
+                return  # already selected - clicking again can toggle it off
+        except PlaywrightTimeoutError:
+            pass  # row missing - let click_row_and_wait report it
         self.click_row_and_wait(row, timeout=timeout, wait_for="action", action_text="Add domain")
 
     # ✅
@@ -309,7 +483,9 @@ class DomainManagement:
         """
         try:
             row = self.row_locator(element_name, tree_title=tree_title)
-            if row.count() == 0:
+            try:
+                expect(row).to_be_attached(timeout=timeout)
+            except AssertionError:
                 raise AssertionError(f"expand_element('{element_name}') failed: element not found in '{tree_title}' tree.")
 
             expect(row).to_be_visible(timeout=timeout)
@@ -318,12 +494,10 @@ class DomainManagement:
             sleep(1)
             arrow_down = row.locator("app-icon[name='arrow-down']").first
             sleep(1)
-            arrow_up = row.locator("app-icon[name='arrow-up']").first
-            sleep(1)
 
             # If arrow-up is visible, it's already expanded
             try:
-                if arrow_up.count() > 0 and arrow_up.is_visible():
+                if row.evaluate(_ROW_ARROWS_JS)["up"]:
                     return False
             except Exception:
                 pass
@@ -333,18 +507,8 @@ class DomainManagement:
                 expect(arrow_down).to_be_visible(timeout=timeout)
                 arrow_down.click(force=True)
 
-                # Wait until it becomes expanded 
-                def expanded() -> bool:
-                    try:
-                        if arrow_up.count() > 0 and arrow_up.is_visible():
-                            return True
-                        if arrow_down.count() > 0 and not arrow_down.is_visible():
-                            return True
-                        return False
-                    except Exception:
-                        return False
-
-                self.wait_until(expanded, timeout_ms=timeout, interval_ms=150)
+                # Wait until it becomes expanded (polled in-page)
+                self.wait_for_element_state(row, _ROW_EXPANDED_JS, timeout=timeout, desc=f"'{element_name}' expanded")
                 return True
 
             # No expander found for that row (leaf node)
@@ -359,48 +523,22 @@ class DomainManagement:
         Wait for a success toast or failure modal and validate the action result.
         """
         try:
-            toast = self.page.locator("div", has_text=re.compile(rf"\b{re.escape(success_text)}\b", re.IGNORECASE)).first
+            toast = self.page.locator("div", has_text=_word_regex_ci(success_text)).first
 
             # Modals you already implemented
             msg_modal = self.message_modal()
             warn_modal = self.warning_remove_modal()
 
-            def toast_visible() -> bool:
-                try:
-                    return toast.count() > 0 and toast.is_visible()
-                except Exception:
-                    return False
-
-            def message_visible() -> bool:
-                try:
-                    return msg_modal.count() > 0 and msg_modal.is_visible()
-                except Exception:
-                    return False
-
-            def warning_visible() -> bool:
-                try:
-                    return warn_modal.count() > 0 and warn_modal.is_visible()
-                except Exception:
-                    return False
-
-            # Wait until either toast appears OR a modal appears
-            self.wait_until(lambda: toast_visible() or message_visible() or warning_visible(),
-                            timeout_ms=timeout, interval_ms=150)
+            # Wait until either toast appears OR a modal appears (one driver-side wait for all three)
+            expect(toast.or_(msg_modal).or_(warn_modal).first).to_be_visible(timeout=timeout)
 
             # If Message modal popped -> click Ok and fail with the message text
-            if message_visible():
-                msg = self.message_text()
-                expect(msg).to_be_visible(timeout=timeout)
-                msg_text = msg.inner_text().strip()
-
-                ok = self.message_ok_btn()
-                expect(ok).to_be_visible(timeout=timeout)
-                ok.click()
-
+            msg_text = self.handle_message_modal_if_present(timeout=timeout)
+            if msg_text is not None:
                 raise AssertionError(f"{failure_label} failed (Message modal): {msg_text}")
 
             # If Warning modal popped -> this helper does NOT auto-confirm (caller should decide)
-            if warning_visible():
+            if warn_modal.is_visible():
                 # Let caller handle Yes/No flows explicitly
                 raise AssertionError(f"{failure_label} blocked (Warning modal appeared). Handle confirmation in the caller.")
 
@@ -477,14 +615,12 @@ class DomainManagement:
 
             tree = self.from_tree()
 
-            device_types = ("DEVICE", "ROADM", "TRANSPONDER", "MUXPONDER")
-
-            is_ip_only = re.fullmatch(r"\d{1,3}(?:\.\d{1,3}){3}", target) is not None
+            is_ip_only = _RX_IPV4.fullmatch(target) is not None
             if is_ip_only:
                 # dev_rx = re.compile(rf"\(\s*{re.escape(target)}\s*\)")
-                dev_rx = re.compile(rf"(^|\()\s*{re.escape(target)}\s*(\)|$)")
+                dev_rx = _device_ip_regex(target)
             else:
-                if re.search(r"\(\s*\d{1,3}(?:\.\d{1,3}){3}\s*\)", target) is None:
+                if _RX_IPV4_IN_PARENS.search(target) is None:
                     raise AssertionError(f"'{target}' does not look like a device row. Use 'NAME (IP)' or IP only.")
                 dev_rx = self.nav_text_regex(target)
 
@@ -521,7 +657,7 @@ class DomainManagement:
                 search_root = parent_row.locator("xpath=ancestor::app-inventory-tree-level[1]")
                 sleep(0.5)
 
-            device_rows = search_root.locator(", ".join([f"div.inventory-tree-level-title[type='{t}']" for t in device_types]))
+            device_rows = search_root.locator(_DEVICE_ROWS_SELECTOR)
             sleep(0.5)
             row = device_rows.filter(has_text=dev_rx).first
 
@@ -532,8 +668,7 @@ class DomainManagement:
                     " If it is under a collapsed 'Chassis: X/X', pass parent_chassis.")
                 )
 
-            # Click device -> enable button
-            row.scroll_into_view_if_needed()
+            # Click device -> enable button (click scrolls the row into view itself)
             expect(row).to_be_visible(timeout=timeout)
             row.click(force=True)
     
@@ -553,7 +688,7 @@ class DomainManagement:
         btn = self.action_btn(action_text)
         sleep(5)
         if action_text != "Remove":
-            self.wait_until(lambda: btn.count() > 0 and btn.is_visible() and btn.is_enabled(), timeout_ms=timeout, interval_ms=150)
+            self.wait_until(lambda: btn.is_visible() and btn.is_enabled(), timeout_ms=timeout, interval_ms=150)
     
     # ✅
     def click_row_and_wait_single_action_enabled(self, row, action_text: str, timeout: int = 8000):
@@ -562,19 +697,18 @@ class DomainManagement:
         Works for: Remove / Rename / Change Chassis ID / Move to domain / Add domain ...
         """
         expect(row).to_be_visible(timeout=timeout)
-        row.scroll_into_view_if_needed()
 
         # Click the row (sometimes first click just focuses; do a small retry loop)
-        start = time.perf_counter()
+        deadline_ns = time.monotonic_ns() + timeout * 1_000_000
         last_err: Optional[Exception] = None
 
-        while (time.perf_counter() - start) * 1000 < timeout:
+        while time.monotonic_ns() < deadline_ns:
             try:
                 row.click(force=True)
 
                 btn = self.action_btn(action_text)
                 # Wait until button is visible AND enabled
-                self.wait_until(lambda: btn.count() > 0 and btn.is_visible() and btn.is_enabled(), timeout_ms=1200, interval_ms=150, 
+                self.wait_until(lambda: btn.is_visible() and btn.is_enabled(), timeout_ms=1200, interval_ms=150, 
                                 desc=f"'{action_text}' button enabled after selecting row")
                 return
             
@@ -600,8 +734,7 @@ class DomainManagement:
         - "none"            -> just click (no waiting)
         """
         expect(row).to_be_visible(timeout=timeout)
-        row.scroll_into_view_if_needed()
-        row.click(force=True)
+        row.click(force=True)  # click scrolls the row into view itself
 
         if wait_for == "none":
             return
@@ -609,35 +742,22 @@ class DomainManagement:
         if wait_for == "action":
             if not action_text:
                 raise ValueError("action_text is required when wait_for='action'")
-            btn = self.action_btn(action_text)
-            self.wait_until(lambda: btn.count() > 0 and btn.is_visible() and btn.is_enabled(), timeout_ms=timeout, interval_ms=150, 
-                            desc=f"bottom action '{action_text}' enabled")
-            return
-
-        if wait_for == "middle_arrow":
-            arrow = self.middle_move_arrow_btn()
-            self.wait_until(lambda: arrow.count() > 0 and arrow.is_visible() and arrow.is_enabled(), timeout_ms=timeout, interval_ms=150,
-                desc="middle arrow enabled")
-            return
-
-        if wait_for == "any_action":
-            # any enabled bottom action button
-            buttons = self.bottom_actions().locator("button.btn")
-            def any_enabled() -> bool:
-                try:
-                    n = buttons.count()
-                    for i in range(n):
-                        b = buttons.nth(i)
-                        if b.is_visible() and b.is_enabled():
-                            return True
-                    return False
-                except Exception:
-                    return False
-
-            self.wait_until(any_enabled, timeout_ms=timeout, interval_ms=150, desc=desc)
-            return
+            target = self.action_btn(action_text)
+            desc = f"bottom action '{action_text}' enabled"
+        elif wait_for == "middle_arrow":
+            target = self.middle_move_arrow_btn()
+            desc = "middle arrow enabled"
+        elif wait_for == "any_action":
+            # any enabled bottom action button (one driver-side wait instead of a count()/nth() scan per poll)
+            target = self.bottom_actions().locator("button.btn:enabled:visible").first
+        else:
+            raise ValueError(f"Unknown wait_for='{wait_for}'")
 
-        raise ValueError(f"Unknown wait_for='{wait_for}'")
+        try:
+            expect(target).to_be_visible(timeout=timeout)
+            expect(target).to_be_enabled(timeout=timeout)
+        except AssertionError as e:
+            raise AssertionError(f"Timed out after {timeout}ms waiting for {desc}. {e}")
 
 
     # ==========================================================
@@ -648,8 +768,12 @@ class DomainManagement:
     def modal(self):
         """
         Return the currently visible modal dialog.
+        While a flow has a modal open, that modal's own locator is returned so the
+        ':visible' scan over every dialog is skipped.
         """
-        return self.page.locator("div.modal-dialog.pl-modal:visible, div.modal-dialog:visible").first
+        if self._current_modal is not None:
+            return self._current_modal
+        return self._cached("modal", lambda: self.page.locator("div.modal-dialog.pl-modal:visible, div.modal-dialog:visible").first)
 
     # ✅
     def modal_title(self):
@@ -670,7 +794,7 @@ class DomainManagement:
         """
         Return a modal button by its text.
         """
-        return self.modal().locator("button", has_text=re.compile(rf"^\s*{re.escape(text)}\s*$")).first
+        return self.modal().locator("button", has_text=_exact_regex(text)).first
 
     # ✅
     def modal_ok_button(self):
@@ -702,47 +826,47 @@ class DomainManagement:
         """
         Return the 'Add new domain' modal window.
         """
-        return (self.page.locator("div.modal-dialog.pl-modal")
-            .filter(has=self.page.locator("div.domain-management-modal-header div.title", has_text=re.compile(r"^\s*Add new domain\s*$"))).first)
+        return self._cached("add_domain_modal", lambda: self.page.locator("div.modal-dialog.pl-modal")
+            .filter(has=self.page.locator("div.domain-management-modal-header div.title", has_text=_RX_ADD_NEW_DOMAIN_TITLE)).first)
 
     # ✅
-    def add_domain_name_input(self):
+    def add_domain_name_input(self, modal=None):
         """
         Return the domain name input field in the Add Domain modal window.
         """
-        return self.add_domain_modal().locator("app-input[formcontrolname='name'] input[type='text']").first
+        return (modal or self.add_domain_modal()).locator("app-input[formcontrolname='name'] input[type='text']").first
 
     # ✅
-    def add_domain_description_input(self):
+    def add_domain_description_input(self, modal=None):
         """
         Return the domain description input field in the Add Domain modal window.
         """
-        modal = self.add_domain_modal()
+        modal = modal or self.add_domain_modal()
         ta = modal.locator("app-input[formcontrolname='description'] textarea").first
         if ta.count() > 0:
             return ta
         return modal.locator("app-input[formcontrolname='description'] input").first
 
     # ✅
-    def add_domain_confirm_btn(self):
+    def add_domain_confirm_btn(self, modal=None):
         """
         Return the 'Add' button in the Add Domain modal window.
         """
-        return self.add_domain_modal().locator("section.form-actions button.btn.btn-primary", has_text="Add").first
+        return (modal or self.add_domain_modal()).locator("section.form-actions button.btn.btn-primary", has_text="Add").first
 
     # ✅
-    def add_domain_close_btn(self):
+    def add_domain_close_btn(self, modal=None):
         """
         Return the close (X) button of the Add Domain modal window.
         """
-        return self.add_domain_modal().locator("div.domain-management-modal-header app-icon[name='close-square']").first
+        return (modal or self.add_domain_modal()).locator("div.domain-management-modal-header app-icon[name='close-square']").first
 
     # ✅
     def add_domain_error_page(self):
         """
         Return the full-page error component shown when add-domain fails.
         """
-        return self.page.locator("app-error").first
+        return self._cached("add_domain_error_page", lambda: self.page.locator("app-error").first)
 
     # ✅
     def add_domain_error_title(self):
@@ -756,7 +880,7 @@ class DomainManagement:
         """
         Return the 'Go to Back' button on the error page.
         """
-        return self.add_domain_error_page().locator("button.btn", has_text=re.compile(r"^\s*Go to Back\s*$")).first
+        return self.add_domain_error_page().locator("button.btn", has_text=_RX_GO_BACK).first
 
     # ✅
     def is_add_domain_error_page_visible(self) -> bool:
@@ -765,7 +889,7 @@ class DomainManagement:
         """
         try:
             p = self.add_domain_error_page()
-            return p.count() > 0 and p.is_visible()
+            return p.is_visible()
         except Exception:
             return False
 
@@ -774,24 +898,30 @@ class DomainManagement:
         """
         If the add-domain error page appears, click 'Go to Back'.
         """
+        error_page = self.add_domain_error_page()
+        title = self.add_domain_error_title()
+        btn = self.add_domain_error_go_back_btn()
+
         try:
-            if not self.is_add_domain_error_page_visible():
-                return
+            if not error_page.is_visible():
+                return False
 
-            title = self.add_domain_error_title()
             expect(title).to_be_visible(timeout=timeout)
-            title_text = title.inner_text().strip()
 
-            btn = self.add_domain_error_go_back_btn()
             expect(btn).to_be_visible(timeout=timeout)
             btn.click(force=True)
 
             # Wait until error page is gone (back to Domain Management)
-            self.wait_until(lambda: not self.is_add_domain_error_page_visible(), timeout_ms=timeout, interval_ms=200)
+            expect(error_page).to_be_hidden(timeout=timeout)
             return True
 
         except Exception as e:
-            print(f"handle_add_domain_error_page failed. Problem: {title_text}")
+            # Title text is only read here, for the log line
+            try:
+                title_text = (title.text_content(timeout=1000) or "").strip()
+            except Exception:
+                title_text = "unknown"
+            print(f"handle_add_domain_error_page failed ('{title_text}'). Problem: {e}")
             return False
 
     # ✅
@@ -806,14 +936,13 @@ class DomainManagement:
 
             # Now the button should be enabled
             btn = self.action_btn("Add domain")
-            expect(btn).to_be_visible(timeout=timeout)
-            expect(btn).to_be_enabled(timeout=timeout)
-            btn.click()
+            btn.click(timeout=timeout)
 
             # Modal window opened
             modal = self.add_domain_modal()
             sleep(0.25)
             expect(modal).to_be_visible(timeout=timeout)
+            self._current_modal = modal
 
         except Exception as e:
             raise AssertionError(f"click_add_domain failed. Problem: {e}")
@@ -829,52 +958,51 @@ class DomainManagement:
             expect(modal).to_be_visible(timeout=timeout)
 
             # Fill name (required)
-            name_inp = self.add_domain_name_input()
+            name_inp = self.add_domain_name_input(modal)
             expect(name_inp).to_be_visible(timeout=timeout)
             name_inp.fill(domain_name)
 
             # Fill description (optional)
             if domain_description:
-                desc_inp = self.add_domain_description_input()
+                desc_inp = self.add_domain_description_input(modal)
                 expect(desc_inp).to_be_visible(timeout=timeout)
                 desc_inp.fill(domain_description)
 
             # Confirm
-            add_btn = self.add_domain_confirm_btn()
-            expect(add_btn).to_be_visible(timeout=timeout)
-            expect(add_btn).to_be_enabled(timeout=timeout)
+            add_btn = self.add_domain_confirm_btn(modal)
             sleep(5)
-            add_btn.click()
+            add_btn.click(timeout=timeout)
+            self._current_modal = None
             sleep(0.25)
 
             # --- Wait for either success toast OR server error banner behind the modal ---
-            toast = self.page.locator("div", has_text=re.compile(r"\bAdd domain\b", re.IGNORECASE)).first
+            toast = self.page.locator("div", has_text=_RX_ADD_DOMAIN_TOAST).first
             sleep(0.25)
-            error_h1 = self.page.locator("app-error h1", has_text=re.compile(r"^\s*Some problems with adding Domain\s*$", re.IGNORECASE)).first
+            error_h1 = self.page.locator("app-error h1", has_text=_RX_ADD_DOMAIN_ERROR_H1).first
             sleep(0.25)
 
             def toast_visible() -> bool:
                 try:
-                    return toast.count() > 0 and toast.is_visible()
+                    return toast.is_visible()
                 except Exception:
                     return False
 
             def error_visible() -> bool:
                 try:
-                    return error_h1.count() > 0 and error_h1.is_visible()
+                    return error_h1.is_visible()
                 except Exception:
                     return False
 
-            # self.wait_until(lambda: toast_visible() or error_visible(), timeout_ms=timeout, interval_ms=150)
+            expect(toast.or_(error_h1).first).to_be_visible(timeout=timeout)
 
             # If server error appeared -> close modal and raise
             if error_visible():
-                close_btn = self.add_domain_close_btn()
+                close_btn = self.add_domain_close_btn(modal)
                 expect(close_btn).to_be_visible(timeout=timeout)
                 close_btn.click(force=True)
 
                 # Ensure modal closed so test can continue cleanly
-                expect(self.add_domain_modal()).to_be_hidden(timeout=timeout)
+                expect(modal).to_be_hidden(timeout=timeout)
 
                 if self.handle_add_domain_error_page(timeout=timeout):
                     raise AssertionError(f"add_domain('{domain_name}') failed: likely domain already exists")
@@ -885,10 +1013,10 @@ class DomainManagement:
             # self.click_button_and_validate_toast(success_text="Add domain", failure_label=f"add_domain('{domain_name}')", timeout=timeout)
 
             # Assert domain appears in tree
-            # self.wait_until(lambda: self.row_locator(domain_name).count() > 0, timeout_ms=timeout, interval_ms=200)
-            expect(self.row_locator(domain_name)).to_be_visible(timeout=timeout)
+            expect(self._row_in(self.from_tree(), domain_name)).to_be_visible(timeout=timeout)
 
         except Exception as e:
+            self._current_modal = None
             raise AssertionError(f"submit_add_domain('{domain_name}') failed. Problem: {e}")
 
     # ✅
@@ -910,11 +1038,8 @@ class DomainManagement:
         """
         Return the Warning modal window shown before domain deletion.
         """
-        warning_remove_modal = (self.page.locator("div.modal-dialog.pl-modal")
-            .filter(has=self.page.locator("div.domain-management-modal-header div.title", has_text=re.compile(r"^\s*Warning\s*$"))).first)
-        sleep(0.5)
-
-        return warning_remove_modal
+        return self._cached("warning_remove_modal", lambda: self.page.locator("div.modal-dialog.pl-modal")
+            .filter(has=self.page.locator("div.domain-management-modal-header div.title", has_text=_RX_WARNING_TITLE)).first)
 
     # ✅
     def warning_yes_btn(self):
@@ -935,22 +1060,22 @@ class DomainManagement:
         """
         Return the message modal displayed when some elements cannot be deleted.
         """
-        return (self.page.locator("div.modal-dialog.pl-modal")
-            .filter(has=self.page.locator("div.domain-management-modal-header div.title", has_text=re.compile(r"^\s*Message\s*$"))).first)
+        return self._cached("message_modal", lambda: self.page.locator("div.modal-dialog.pl-modal")
+            .filter(has=self.page.locator("div.domain-management-modal-header div.title", has_text=_RX_MESSAGE_TITLE)).first)
 
     # ✅
-    def message_text(self):
+    def message_text(self, modal=None):
         """
         Return the text content of the Message modal window.
         """
-        return self.message_modal().locator("div.domain-management-modal-content article").first
+        return (modal or self.message_modal()).locator("div.domain-management-modal-content article").first
 
     # ✅
-    def message_ok_btn(self):
+    def message_ok_btn(self, modal=None):
         """
         Return the 'Ok' button in the Message modal window.
         """
-        return self.message_modal().locator("section.form-actions button.btn.btn-primary", has_text="Ok").first
+        return (modal or self.message_modal()).locator("section.form-actions button.btn.btn-primary", has_text="Ok").first
 
     # ✅
     def click_remove_domain_btn(self, domain_name: str, timeout: int = 5000):
@@ -958,8 +1083,7 @@ class DomainManagement:
         Select a domain and click the Remove button.
         """
         # Validate domain exists
-        row = self.row_locator(domain_name, tree_title="From")
-        if row.count() == 0:
+        if not self._has_row(domain_name, tree_title="From"):
             raise AssertionError(f"remove_domain('{domain_name}') failed: element not found in tree.")
 
         # Select domain
@@ -1104,13 +1228,14 @@ class DomainManagement:
             # Warning modal must appear
             warn = self.warning_remove_modal()
 
-            if not (warn.count() > 0 and warn.is_visible()):
+            try:
+                expect(warn).to_be_visible(timeout=timeout)
+            except AssertionError:
                 # Maybe already deleted meanwhile
                 if self.verify_element_deleted(target, element_type="domain", tree_title="From", refresh=True):
                     return
                 raise AssertionError(f"remove_domain('{target}') failed: Warning modal did not appear.")
-
-            expect(warn).to_be_visible(timeout=timeout)
+            self._current_modal = warn
 
             # Optional validation of warning text
             try:
@@ -1124,9 +1249,8 @@ class DomainManagement:
 
             # Confirm deletion
             yes = self.warning_yes_btn()
-            expect(yes).to_be_visible(timeout=timeout)
-            expect(yes).to_be_enabled(timeout=timeout)
-            yes.click()
+            yes.click(timeout=timeout)
+            self._current_modal = None
 
             refresh_page(self.page)
             countdown_sleep(RENDER_WAIT_TIME, message="Wait for the system to render")
@@ -1136,6 +1260,7 @@ class DomainManagement:
                 raise AssertionError(f"remove_domain('{target}') failed: domain still exists in tree.")
 
         except Exception as e:
+            self._current_modal = None
             raise AssertionError(f"remove_domain('{domain_name}') failed. Problem: {e}")
 
     # ✅
@@ -1165,13 +1290,13 @@ class DomainManagement:
 
             def warning_visible() -> bool:
                 try:
-                    return warn.count() > 0 and warn.is_visible()
+                    return warn.is_visible()
                 except Exception:
                     return False
 
             def message_visible() -> bool:
                 try:
-                    return msg.count() > 0 and msg.is_visible()
+                    return msg.is_visible()
                 except Exception:
                     return False
                 
@@ -1267,13 +1392,13 @@ class DomainManagement:
 
             def warning_visible() -> bool:
                 try:
-                    return warn.count() > 0 and warn.is_visible()
+                    return warn.is_visible()
                 except Exception:
                     return False
 
             def message_visible() -> bool:
                 try:
-                    return msg.count() > 0 and msg.is_visible()
+                    return msg.is_visible()
                 except Exception:
                     return False
                 
@@ -1283,16 +1408,8 @@ class DomainManagement:
             # self.wait_until(lambda: warning_visible() or message_visible(), timeout_ms=timeout, interval_ms=150)
 
             # If Message modal popped -> cannot delete (or blocked)
-            if message_visible():
-                t = self.message_text()
-                expect(t).to_be_visible(timeout=timeout)
-                msg_text = t.inner_text().strip()
-
-                ok = self.message_ok_btn()
-                expect(ok).to_be_visible(timeout=timeout)
-                sleep(1)
-                ok.click()
-
+            msg_text = self.handle_message_modal_if_present(timeout=timeout)
+            if msg_text is not None:
                 raise AssertionError(f"remove_chassis('{name}') failed (Message modal): {msg_text}")
 
             # Warning modal must appear -> confirm
@@ -1313,16 +1430,8 @@ class DomainManagement:
             # except Exception:
             #     pass
 
-            if message_visible():
-                t = self.message_text()
-                expect(t).to_be_visible(timeout=timeout)
-                msg_text = t.inner_text().strip()
-
-                ok = self.message_ok_btn()
-                expect(ok).to_be_visible(timeout=timeout)
-                sleep(1)
-                ok.click()
-
+            msg_text = self.handle_message_modal_if_present(timeout=timeout)
+            if msg_text is not None:
                 raise AssertionError(f"remove_chassis('{name}') failed after confirmation (Message modal): {msg_text}")
 
             # Verify chassis removed from tree
@@ -1374,29 +1483,22 @@ class DomainManagement:
 
             def warning_visible() -> bool:
                 try:
-                    return warn.count() > 0 and warn.is_visible()
+                    return warn.is_visible()
                 except Exception:
                     return False
 
             def message_visible() -> bool:
                 try:
-                    return msg.count() > 0 and msg.is_visible()
+                    return msg.is_visible()
                 except Exception:
                     return False
 
             # Wait until either Warning OR Message modal appears
-            # self.wait_until(lambda: warning_visible() or message_visible(), timeout_ms=timeout, interval_ms=150)
+            expect(warn.or_(msg).first).to_be_visible(timeout=timeout)
 
             # If Message modal popped -> cannot delete
-            if message_visible():
-                t = self.message_text()
-                expect(t).to_be_visible(timeout=timeout)
-                msg_text = t.inner_text().strip()
-
-                ok = self.message_ok_btn()
-                expect(ok).to_be_visible(timeout=timeout)
-                ok.click()
-
+            msg_text = self.handle_message_modal_if_present(timeout=timeout)
+            if msg_text is not None:
                 raise AssertionError(f"remove_device('{target}') failed (Message modal): {msg_text}")
 
             # Warning modal must appear -> confirm
@@ -1413,15 +1515,8 @@ class DomainManagement:
             # except Exception:
             #     pass
 
-            if message_visible():
-                t = self.message_text()
-                expect(t).to_be_visible(timeout=timeout)
-                msg_text = t.inner_text().strip()
-
-                ok = self.message_ok_btn()
-                expect(ok).to_be_visible(timeout=timeout)
-                ok.click()
-
+            msg_text = self.handle_message_modal_if_present(timeout=timeout)
+            if msg_text is not None:
                 raise AssertionError(f"remove_device('{target}') failed after confirmation (Message modal): {msg_text}")
 
             # Verify device removed from tree
@@ -1451,6 +1546,9 @@ class DomainManagement:
             if refresh:
                 refresh_page(self.page)
 
+            # count() below is a snapshot - make sure the trees rendered before trusting a 0
+            expect(self.tree_container()).to_be_visible(timeout=timeout)
+
             et = element_type.strip().lower()
 
             if et == "domain":
@@ -1511,8 +1609,8 @@ class DomainManagement:
         """
         Return the Rename Chassis modal window.
         """
-        return (self.page.locator("div.modal-dialog.pl-modal")
-            .filter(has=self.page.locator("div.domain-management-modal-header div.title", has_text=re.compile(r"^\s*Rename chassis\s*$"))).first)
+        return self._cached("rename_chassis_modal", lambda: self.page.locator("div.modal-dialog.pl-modal")
+            .filter(has=self.page.locator("div.domain-management-modal-header div.title", has_text=_RX_RENAME_CHASSIS_TITLE)).first)
 
     # ✅
     def rename_chassis_name_input(self):
@@ -1574,6 +1672,7 @@ class DomainManagement:
             # Assert modal opened (per your HTML)
             modal = self.rename_chassis_modal()
             expect(modal).to_be_visible(timeout=timeout)
+            self._current_modal = modal
 
         except Exception as e:
             raise AssertionError(f"click_rename_chassis('{chassis_name}') failed. Problem: {e}")
@@ -1597,12 +1696,12 @@ class DomainManagement:
                 desc_inp.fill(new_description)
 
             update_btn = self.rename_chassis_update_btn()
-            expect(update_btn).to_be_visible(timeout=timeout)
-            expect(update_btn).to_be_enabled(timeout=timeout)
             sleep(5)
-            update_btn.click()
+            update_btn.click(timeout=timeout)
+            self._current_modal = None
 
         except Exception as e:
+            self._current_modal = None
             raise AssertionError(f"submit_rename_chassis('{new_name}') failed. Problem: {e}")
 
     # ✅        
@@ -1613,20 +1712,16 @@ class DomainManagement:
         try:
             refresh_page(self.page)
             self.click_rename_chassis(old_chassis_name, timeout=timeout)
-            sleep(1)
             self.submit_rename_chassis(new_chassis_name, new_description=new_description, timeout=timeout)
-            sleep(1)
 
-            # change the name format for verification
-            new_expanded_chassis_name = self.expand_name_with_number(new_chassis_name)
-
-            # Assert old disappears and new appears in tree
-            if (self.row_locator(new_chassis_name).count() > 0):
-                self.wait_until(lambda: self.row_locator(new_chassis_name).count() > 0, timeout_ms=timeout, interval_ms=200)
-            elif (self.row_locator(new_expanded_chassis_name).count() > 0):
-                self.wait_until(lambda: self.row_locator(new_expanded_chassis_name).count() > 0, timeout_ms=timeout, interval_ms=200)
+            # Rename is applied once the modal closes (if it stays open, the tree checks below report it)
+            try:
+                expect(self.rename_chassis_modal()).to_be_hidden(timeout=timeout)
+            except AssertionError:
+                pass
 
-            expect(self.row_locator(new_chassis_name)).to_be_visible(timeout=timeout)
+            # Assert new name appears in tree
+            expect(self._row_in(self.from_tree(), new_chassis_name)).to_be_visible(timeout=timeout)
             refresh_page(self.page)
             countdown_sleep(RENDER_WAIT_TIME, message="Wait for the system to render")  # Allow UI to stabilize
 
@@ -1642,17 +1737,15 @@ class DomainManagement:
         """
         Expand a tree node (Domain/Chassis/etc.) if it's collapsed.
         """
-        level = title_row.locator("xpath=ancestor::app-inventory-tree-level[1]")
-        collapse = level.locator("div.collapse").first
+        # Collapse container state of this node, resolved in one in-page walk
+        state = title_row.evaluate(_ROW_COLLAPSE_STATE_JS, timeout=timeout)
 
         # If no collapse container, nothing to expand
-        if collapse.count() == 0:
+        if state is None:
             return False
 
         # Decide collapsed state
-        aria_hidden = (collapse.get_attribute("aria-hidden") or "").strip().lower()
-        style = (collapse.get_attribute("style") or "").lower()
-        is_collapsed = (aria_hidden == "true") or ("display: none" in style)
+        is_collapsed = (state["ah"] == "true") or ("display: none" in state["st"])
 
         if not is_collapsed:
             return False
@@ -1662,13 +1755,8 @@ class DomainManagement:
 
         arrow_down.click(force=True)
 
-        # Wait expanded
-        def expanded() -> bool:
-            ah = (collapse.get_attribute("aria-hidden") or "").strip().lower()
-            st = (collapse.get_attribute("style") or "").lower()
-            return (ah == "false") or ("display: block" in st) or ("show" in (collapse.get_attribute("class") or ""))
-
-        self.wait_until(expanded, timeout_ms=timeout, interval_ms=150)
+        # Wait expanded (polled in-page)
+        self.wait_for_element_state(title_row, _ROW_COLLAPSE_EXPANDED_JS, timeout=timeout, desc="tree node expanded")
         return True
 
     # ✅
@@ -1676,16 +1764,16 @@ class DomainManagement:
         """
         Return the 'Changing chassis ID for <ip>' modal window.
         """
-        return (self.page.locator("div.modal-dialog.pl-modal").filter(has=self.page.locator("div.domain-management-modal-header div.title",
-                has_text=re.compile(r"^\s*Changing chassis ID for\s+.+\s*$", re.IGNORECASE))).first)
+        return self._cached("change_chassis_id_modal", lambda: self.page.locator("div.modal-dialog.pl-modal")
+            .filter(has=self.page.locator("div.domain-management-modal-header div.title", has_text=_RX_CHANGE_CHASSIS_TITLE)).first)
 
     # ✅
-    def change_the_chassis_ID_to_new_chassis_ID(self, timeout: int = 5000):
+    def change_the_chassis_ID_to_new_chassis_ID(self, timeout: int = 5000, modal=None):
         """
         Select the 'New Chassis ID' option.
         """
         try:
-            modal = self.change_CHASSIS_ID_modal()
+            modal = modal or self.change_CHASSIS_ID_modal()
             expect(modal).to_be_visible(timeout=timeout)
 
             # Click the LABEL 
@@ -1694,146 +1782,138 @@ class DomainManagement:
             lbl.click(force=True)
 
             # Verify selection by label class 
-            expect(lbl).to_have_class(re.compile(r"\bchecked\b"), timeout=timeout)
-            sleep(0.5)
+            expect(lbl).to_have_class(_RX_CHECKED, timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"change_the_chassis_ID_to_new_chassis_ID failed. Problem: {e}")
 
     # ✅
-    def change_the_chassis_ID_to_existing_chassis_ID(self, timeout: int = 5000):
+    def change_the_chassis_ID_to_existing_chassis_ID(self, timeout: int = 5000, modal=None):
         """
         Select the 'Existing Chassis ID' option.
         """
         try:
-            modal = self.change_CHASSIS_ID_modal()
+            modal = modal or self.change_CHASSIS_ID_modal()
             expect(modal).to_be_visible(timeout=timeout)
 
             lbl = modal.locator("label[for='radio-existing']").first
             expect(lbl).to_be_visible(timeout=timeout)
             lbl.click(force=True)
 
-            expect(lbl).to_have_class(re.compile(r"\bchecked\b"), timeout=timeout)
-
-            sleep(0.5)
+            expect(lbl).to_have_class(_RX_CHECKED, timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"change_the_chassis_ID_to_existing_chassis_ID failed. Problem: {e}")
 
     # ✅
-    def change_the_chassis_ID_next_btn(self, timeout: int = 5000):
+    def change_the_chassis_ID_next_btn(self, timeout: int = 5000, modal=None):
         """
         Click the 'Next' button in the Change Chassis ID modal.
         """
         try:
-            btn = self.change_CHASSIS_ID_modal().locator("section.form-actions button.btn.btn-primary", has_text=re.compile(r"^\s*Next\s*$")).first
-
-            expect(btn).to_be_visible(timeout=timeout)
-            expect(btn).to_be_enabled(timeout=timeout)
-            btn.click()
+            btn = (modal or self.change_CHASSIS_ID_modal()).locator("section.form-actions button.btn.btn-primary", has_text=_RX_NEXT).first
+            btn.click(timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"change_the_chassis_ID_next_btn failed. Problem: {e}")
 
     # ✅
-    def close_change_the_chassis_ID_window(self, timeout: int = 5000):
+    def close_change_the_chassis_ID_window(self, timeout: int = 5000, modal=None):
         """
         Close the Change Chassis ID modal using the X button.
         """
         try:
-            close_btn = self.change_CHASSIS_ID_modal().locator("div.domain-management-modal-header app-icon[name='close-square']").first
+            modal = modal or self.change_CHASSIS_ID_modal()
+            close_btn = modal.locator("div.domain-management-modal-header app-icon[name='close-square']").first
 
             expect(close_btn).to_be_visible(timeout=timeout)
             close_btn.click()
 
             # Ensure modal is closed
-            expect(self.change_CHASSIS_ID_modal()).to_be_hidden(timeout=timeout)
+            expect(modal).to_be_hidden(timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"close_change_the_chassis_ID_window failed. Problem: {e}")
 
     # ✅
-    def change_the_chassis_ID_previous_btn(self, timeout: int = 5000):
+    def change_the_chassis_ID_previous_btn(self, timeout: int = 5000, modal=None):
         """
         Click the 'Previous' button in the Change Chassis ID modal.
         """
         try:
-            btn = self.change_CHASSIS_ID_modal().locator("section.form-actions button.btn.btn-primary", has_text=re.compile(r"^\s*Previous\s*$", re.IGNORECASE)).first
-
-            expect(btn).to_be_visible(timeout=timeout)
-            expect(btn).to_be_enabled(timeout=timeout)
-            btn.click()
+            btn = (modal or self.change_CHASSIS_ID_modal()).locator("section.form-actions button.btn.btn-primary", has_text=_RX_PREVIOUS).first
+            btn.click(timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"change_the_chassis_ID_previous_btn failed. Problem: {e}")
 
     # ✅
-    def change_the_chassis_ID_save_btn(self, timeout: int = 5000):
+    def change_the_chassis_ID_save_btn(self, timeout: int = 5000, modal=None):
         """
         Click the 'Save' button in the Change Chassis ID modal.
         """
         try:
-            btn = self.change_CHASSIS_ID_modal().locator("section.form-actions button.btn.btn-primary",has_text=re.compile(r"^\s*Save\s*$", re.IGNORECASE)).first
-
-            expect(btn).to_be_visible(timeout=timeout)
-            expect(btn).to_be_enabled(timeout=timeout)
-            btn.click()
+            btn = (modal or self.change_CHASSIS_ID_modal()).locator("section.form-actions button.btn.btn-primary", has_text=_RX_SAVE).first
+            btn.click(timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"change_the_chassis_ID_save_btn failed. Problem: {e}")
 
     # ✅
-    def set_new_chassis_ID(self, new_chassis_id: str | int, timeout: int = 5000):
+    def set_new_chassis_ID(self, new_chassis_id: str | int, timeout: int = 5000, modal=None):
         """
         Fill the 'New Chassis ID' number input in the Change Chassis ID modal.
         """
         try:
-            inp = self.change_CHASSIS_ID_modal().locator("app-input[label='New Chassis ID'] input[type='number']").first
+            inp = (modal or self.change_CHASSIS_ID_modal()).locator("app-input[label='New Chassis ID'] input[type='number']").first
 
             expect(inp).to_be_visible(timeout=timeout)
 
-            # Clear first to avoid leftovers
-            inp.fill("")
-            inp.fill(str(new_chassis_id))
+            value = str(new_chassis_id)
+            if inp.input_value(timeout=timeout) == value:
+                return
 
-            sleep(0.5)
+            # fill() replaces the whole value, so no separate clear is needed
+            inp.fill(value)
+            expect(inp).to_have_value(value, timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"set_new_chassis_ID('{new_chassis_id}') failed. Problem: {e}")
 
     # ✅
-    def select_chassis_ID(self, chassis_id_to_select: str, timeout: int = 5000):
+    def select_chassis_ID(self, chassis_id_to_select: str, timeout: int = 5000, modal=None):
         """
         Open the 'Select Chassis ID' dropdown and pick the requested chassis ID.
         """
         try:
-            sleep(0.5)
-            modal = self.change_CHASSIS_ID_modal()
+            modal = modal or self.change_CHASSIS_ID_modal()
             expect(modal).to_be_visible(timeout=timeout)
 
+            # Use flexible regex helper to match items despite spaces / dash variants
+            rx = self.nav_text_regex(chassis_id_to_select)
+
+            # Already selected -> nothing to do (full match: "BS-1" must not be satisfied by "BS-12")
+            toggle = modal.locator("button#button-basic")
+            if rx.fullmatch(" ".join((toggle.inner_text(timeout=timeout) or "").split())):
+                return
+
             # Click the dropdown toggle 
-            toggle = modal.locator("button#button-basic").first
-            expect(toggle).to_be_visible(timeout=timeout)
-            expect(toggle).to_be_enabled(timeout=timeout)
-            toggle.click()
-            sleep(0.5)
+            toggle.click(timeout=timeout)
 
-            menu = modal.locator("div#dropdown-basic.dropdown-menu.show").first
+            menu = modal.locator("div#dropdown-basic.dropdown-menu.show")
             expect(menu).to_be_visible(timeout=timeout)
 
-            # Use flexible regex helper to match items despite spaces / dash variants
-            rx = self.nav_text_regex(chassis_id_to_select)
-
             option = menu.locator("li.dropdown-item[role='menuitem']", has_text=rx).first
-            if option.count() == 0:
+            try:
+                expect(option).to_be_attached(timeout=timeout)
+            except AssertionError:
                 raise AssertionError(f"Chassis ID '{chassis_id_to_select}' not found in dropdown options.")
 
-            option.scroll_into_view_if_needed()
             expect(option).to_be_visible(timeout=timeout)
-            option.click()
+            option.click()  # click scrolls the option into view itself
 
             # Verify dropdown selection updated 
-            self.wait_until(lambda: rx.search((toggle.inner_text() or "").strip()) is not None, timeout_ms=timeout, interval_ms=150)
+            expect(toggle).to_have_text(rx, timeout=timeout)
 
         except Exception as e:
             raise AssertionError(f"select_chassis_ID('{chassis_id_to_select}') failed. Problem: {e}")
@@ -1846,20 +1926,17 @@ class DomainManagement:
         If the device is under a domain node (already visible), only pass chassis_id.
         """
         try:
-            sleep(1)
             target = (element_name or "").strip()
             if not target:
                 raise ValueError("element_name is empty")
 
             tree = self.from_tree()
 
-            device_types = ("ROADM", "TRANSPONDER", "MUXPONDER", "DEVICE")
-
-            is_ip_only = re.fullmatch(r"\d{1,3}(?:\.\d{1,3}){3}", target) is not None
+            is_ip_only = _RX_IPV4.fullmatch(target) is not None
             if is_ip_only:
-                dev_rx = re.compile(rf"\(\s*{re.escape(target)}\s*\)")
+                dev_rx = _device_ip_regex(target, parens_only=True)
             else:
-                if re.search(r"\(\s*\d{1,3}(?:\.\d{1,3}){3}\s*\)", target) is None:
+                if _RX_IPV4_IN_PARENS.search(target) is None:
                     raise AssertionError(f"'{target}' does not look like a device row. Use 'NAME (IP)' or IP only.")
                 dev_rx = self.nav_text_regex(target)
 
@@ -1873,50 +1950,46 @@ class DomainManagement:
                     raise ValueError("parent_chassis is empty")
 
                 parent_rx = self.nav_text_regex(parent)
-                sleep(0.5)
 
-                parent_row = tree.locator("div.inventory-tree-level-title[type='CHASSIS']").filter(has_text=parent_rx).first
-                sleep(0.5)
-
-                if parent_row.count() == 0:
-                    # fallback: if in some builds it isn't typed as CHASSIS
-                    parent_row = tree.locator("div.inventory-tree-level-title").filter(has_text=parent_rx).first
-                    sleep(0.5)
+                typed_row = tree.locator("div.inventory-tree-level-title[type='CHASSIS']", has_text=parent_rx).first
+                # fallback: if in some builds it isn't typed as CHASSIS
+                any_row = tree.locator("div.inventory-tree-level-title", has_text=parent_rx).first
 
-                if parent_row.count() == 0:
+                # One auto-waiting check for either, then prefer the typed CHASSIS row whenever it exists
+                try:
+                    expect(typed_row.or_(any_row).first).to_be_attached(timeout=timeout)
+                except AssertionError:
                     raise AssertionError(f"parent_chassis '{parent}' not found in 'From' tree.")
 
-                parent_row.scroll_into_view_if_needed()
+                parent_row = typed_row if typed_row.count() > 0 else any_row
                 expect(parent_row).to_be_visible(timeout=timeout)
 
-                # Expand chassis if needed 
+                # Expand chassis if needed (the arrow click scrolls it into view itself)
                 self.expand_tree_node_if_collapsed(parent_row, timeout=timeout)
 
                 # Scope future device lookup ONLY inside this chassis subtree
                 search_root = parent_row.locator("xpath=ancestor::app-inventory-tree-level[1]")
-                sleep(0.5)
 
-            device_rows = search_root.locator(", ".join([f"div.inventory-tree-level-title[type='{t}']" for t in device_types]))
-            sleep(0.5)
-            row = device_rows.filter(has_text=dev_rx).first
+            row = search_root.locator(_DEVICE_ROWS_SELECTOR, has_text=dev_rx).first
 
-            if row.count() == 0:
+            try:
+                expect(row).to_be_visible(timeout=timeout)
+            except AssertionError:
                 raise AssertionError(
                     f"Device '{target}' was not found."
                     + (f" (under parent_chassis='{parent_chassis}')" if parent_chassis else
                     " If it is under a collapsed 'Chassis: X/X', pass parent_chassis.")
                 )
 
-            # Click device -> enable button
-            row.scroll_into_view_if_needed()
-            expect(row).to_be_visible(timeout=timeout)
+            # Click device -> enable button (click scrolls the row into view itself)
             row.click(force=True)
 
             btn = self.action_btn("Change Chassis ID")
-            self.wait_until(lambda: btn.count() > 0 and btn.is_visible() and btn.is_enabled(),
-                            timeout_ms=timeout, interval_ms=150)
+            expect(btn).to_be_enabled(timeout=timeout)
             btn.click()
-            sleep(1)
+
+            # Modal window opened
+            expect(self.change_CHASSIS_ID_modal()).to_be_visible(timeout=timeout)
             return True
 
         except Exception as e:
@@ -1938,29 +2011,18 @@ class DomainManagement:
                     raise AssertionError(f"Invalid to_mode='{to_mode}'. Expected 'new' or 'existing'.")
 
                 # 1) Open the Change Chassis ID modal
-                if parent_chassis:
-                    self.click_change_CHASSIS_ID(element_name, parent_chassis, timeout=timeout)
-                else:
-                    self.click_change_CHASSIS_ID(element_name, timeout=timeout)
+                self.click_change_CHASSIS_ID(element_name, parent_chassis=parent_chassis, timeout=timeout)
 
                 modal = self.change_CHASSIS_ID_modal()
                 expect(modal).to_be_visible(timeout=timeout)
 
-                # Title sanity check
-                try:
-                    title = modal.locator("div.domain-management-modal-header div.title").first
-                    if title.count() > 0:
-                        expect(title).to_be_visible(timeout=timeout)
-                except Exception:
-                    pass
-
                 # 2) Choose New/Existing and click Next
                 if mode == "new":
-                    self.change_the_chassis_ID_to_new_chassis_ID(timeout=timeout)
+                    self.change_the_chassis_ID_to_new_chassis_ID(timeout=timeout, modal=modal)
                 else:
-                    self.change_the_chassis_ID_to_existing_chassis_ID(timeout=timeout)
+                    self.change_the_chassis_ID_to_existing_chassis_ID(timeout=timeout, modal=modal)
 
-                self.change_the_chassis_ID_next_btn(timeout=timeout)
+                self.change_the_chassis_ID_next_btn(timeout=timeout, modal=modal)
 
                 # 3) Either fill New Chassis ID OR select from dropdown
                 if mode == "new":
@@ -1972,7 +2034,7 @@ class DomainManagement:
                     expect(new_input).to_be_visible(timeout=timeout)
 
                     # Fill value using your setter
-                    self.set_new_chassis_ID(new_chassis_id, timeout=timeout)
+                    self.set_new_chassis_ID(new_chassis_id, timeout=timeout, modal=modal)
 
                 else:
                     if not existing_chassis_id:
@@ -1982,20 +2044,20 @@ class DomainManagement:
                         existing_chassis_id = self.normalize_chassis_name(existing_chassis_id)
 
                     # Wait until the dropdown exists 
-                    dd_toggle = modal.locator("button#button-basic").first
+                    dd_toggle = modal.locator("button#button-basic")
                     expect(dd_toggle).to_be_visible(timeout=timeout)
 
                     # Select option using dropdown function 
-                    self.select_chassis_ID(existing_chassis_id, timeout=timeout)
+                    self.select_chassis_ID(existing_chassis_id, timeout=timeout, modal=modal)
 
                 # 4) Save + validate success toast
-                self.change_the_chassis_ID_save_btn(timeout=timeout)
+                self.change_the_chassis_ID_save_btn(timeout=timeout, modal=modal)
 
                 # self.click_button_and_validate_toast(success_text="Success", failure_label=f"change_CHASSIS_ID('{chassis_id}', mode='{mode}')", timeout=max(timeout, 8000))
 
                 # Optional: modal should close after success 
                 try:
-                    expect(self.change_CHASSIS_ID_modal()).to_be_hidden(timeout=timeout)
+                    expect(modal).to_be_hidden(timeout=timeout)
                 except Exception:
                     pass
 
@@ -2006,7 +2068,7 @@ class DomainManagement:
             except Exception as e:
                 try:
                     close_btn = self.change_CHASSIS_ID_modal().locator("div.domain-management-modal-header app-icon[name='close-square']").first
-                    if close_btn.count() > 0 and close_btn.is_visible():
+                    if close_btn.is_visible():
                         close_btn.click()
                 except Exception:
                     pass
@@ -2027,29 +2089,21 @@ class DomainManagement:
         """
         try:
             modal = self.message_modal()
-            if modal.count() == 0:
-                return None
-
-            # Make sure it's actually visible
             if not modal.is_visible():
                 return None
 
-            msg = self.message_text()
-            expect(msg).to_be_visible(timeout=timeout)
-            msg_text = msg.inner_text().strip()
-
-            ok = self.message_ok_btn()
-            expect(ok).to_be_visible(timeout=timeout)
-            ok.click()
+            # Text and Ok button are scoped to the modal resolved above
+            msg_text = self.message_text(modal).inner_text(timeout=timeout).strip()
+            self.message_ok_btn(modal).click(timeout=timeout)
 
             # Ensure it closed
             expect(modal).to_be_hidden(timeout=timeout)
 
             return msg_text
 
-        except Exception:
+        except Exception as e:
             # If something went wrong while handling, don't silently swallow it.
-            raise AssertionError("Failed to handle message modal.")
+            raise AssertionError(f"Failed to handle message modal. Problem: {e}") from e
 
     # ✅
     def handle_message_modal_with_x_if_present(self, timeout: int = 5000) -> str | None:
@@ -2060,22 +2114,25 @@ class DomainManagement:
         try:
             modal = self.message_modal()
 
-            if modal.count() == 0 or not modal.is_visible():
+            if not modal.is_visible():
                 return None
 
             expect(modal).to_be_visible(timeout=timeout)
+            self._current_modal = modal
 
-            message_text = (self.message_text().text_content() or "").strip()
+            message_text = (self.message_text(modal).text_content(timeout=timeout) or "").strip()
 
             close_btn = self.modal_close_x()
             expect(close_btn).to_be_visible(timeout=timeout)
             close_btn.click()
+            self._current_modal = None
 
             expect(modal).not_to_be_visible(timeout=timeout)
 
             return message_text
 
         except Exception as e:
+            self._current_modal = None
             raise AssertionError(f"handle_message_modal_with_x_if_present failed. Problem: {e}")
 
     # ✅
@@ -2083,10 +2140,7 @@ class DomainManagement:
         """
         Return the middle arrow button used to move items between trees.
         """
-        middle_move_arrow_btn = self.page.locator("div.domain-management-middle-actions button.btn").first
-        sleep(0.5)
-
-        return middle_move_arrow_btn
+        return self._cached("middle_move_arrow_btn", lambda: self.page.locator("div.domain-management-middle-actions button.btn").first)
 
     # ✅
     def click_move_to_domain_mode(self, timeout: int = 5000):
@@ -2122,8 +2176,6 @@ class DomainManagement:
 
             # 1) Select SOURCE in "From" tree
             src_row = self.row_locator(source_item_name, tree_title="From")
-            expect(src_row).to_be_visible(timeout=timeout)
-            src_row.scroll_into_view_if_needed()
             self.click_row_and_wait(
                 src_row,
                 timeout=timeout,
@@ -2133,18 +2185,16 @@ class DomainManagement:
             )
 
             # 2) Enable Move-to-domain mode
-            if self.to_tree().count() == 0 or not self.to_tree().is_visible():
+            if not self.to_tree().is_visible():
                 self.click_move_to_domain_mode(timeout=timeout)
             else:
                 move_btn = self.action_btn("Move to domain")
-                if move_btn.count() > 0 and move_btn.is_visible() and move_btn.is_enabled():
+                if move_btn.is_visible() and move_btn.is_enabled():
                     move_btn.click()
                     expect(self.to_tree()).to_be_visible(timeout=timeout)
 
             # 3) Select TARGET in "To" tree
             tgt_row = self.row_locator(target_domain_name, tree_title="To")
-            expect(tgt_row).to_be_visible(timeout=timeout)
-            tgt_row.scroll_into_view_if_needed()
             self.click_row_and_wait(
                 tgt_row,
                 timeout=timeout,
@@ -2154,14 +2204,16 @@ class DomainManagement:
 
             # 4) Click middle arrow
             arrow = self.middle_move_arrow_btn()
-            expect(arrow).to_be_visible(timeout=timeout)
-            expect(arrow).to_be_enabled(timeout=timeout)
-            arrow.click()
+            arrow.click(timeout=timeout)
 
-            # 5) Handle Warning modal if it appears
+            # 5) Handle Warning modal if it appears (short wait - a successful move may show no modal at all)
             try:
                 warn = self.warning_remove_modal()
-                if warn.count() > 0 and warn.is_visible():
+                try:
+                    expect(warn.or_(self.message_modal()).first).to_be_visible(timeout=min(timeout, 1000))
+                except AssertionError:
+                    pass
+                if warn.is_visible():
                     yes = self.warning_yes_btn()
                     expect(yes).to_be_visible(timeout=timeout)
                     expect(yes).to_be_enabled(timeout=timeout)
@@ -2189,8 +2241,17 @@ class DomainManagement:
                     f"failed (Message modal): {msg_text}"
                 )
 
+            # Reload leaves Move mode and pulls the committed tree
             refresh_page(self.page)
-            countdown_sleep(RENDER_WAIT_TIME, message="Wait for the system to render")
+
+            # Confirm the move: the item must now sit inside the target domain's subtree
+            # (attached, not visible - the target node may render collapsed)
+            target_level = self._row_in(self.from_tree(), target_domain_name).locator("xpath=ancestor::app-inventory-tree-level[1]")
+            moved_row = target_level.locator("app-inventory-tree-level div.inventory-tree-level-title", has_text=self.nav_text_regex(source_item_name)).first
+            try:
+                expect(moved_row).to_be_attached(timeout=RENDER_WAIT_TIME * 1000)
+            except AssertionError:
+                raise AssertionError(f"'{source_item_name}' did not appear under '{target_domain_name}' after the move.")
             return True
 
         except Exception as e:
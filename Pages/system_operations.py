@@ -10,6 +10,19 @@ from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from Utils.utils import refresh_page, countdown_sleep
 
 
+# [toast_visible, overlay_visible] in one in-page check.
+# The text match is case-insensitive and whitespace-normalized (like the text= selector) and only reads
+# the CDK overlay container the toast renders into (whole body only if that container is missing).
+_TOAST_AND_OVERLAY_STATE_JS = """msg => {
+    const norm = s => (s || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+    const shown = el => !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const overlay = document.querySelector('div.cdk-global-overlay-wrapper');
+    const scope = document.querySelector('div.cdk-overlay-container') || document.body;
+    return [norm(scope.innerText).includes(norm(msg)), shown(overlay)];
+}"""
+_TOAST_AND_OVERLAY_VISIBLE_JS = f"msg => ({_TOAST_AND_OVERLAY_STATE_JS})(msg).every(Boolean)"
+_TOAST_AND_OVERLAY_HIDDEN_JS = f"msg => !({_TOAST_AND_OVERLAY_STATE_JS})(msg).some(Boolean)"
+
 class SystemOperationsPage:
     """
     System Operations page – Provides high-level methods to trigger system actions (polling restart, OTN/ROADM sync and cleanup)
@@ -77,40 +90,39 @@ class SystemOperationsPage:
         success_message = "OTN services removed Successfully"
         failure_message = "Delete Inconsistent OTN Services"
         self.deleting_otn_inconsistent_services_btn.click()
-        self.click_button(success_message, failure_message)
+        return self.click_button(success_message, failure_message)
 
     # ✅
     def click_synchronizing_OTN_services(self) -> bool:
         success_message = "OTN services synchronized Successfully"
         failure_message = "Synchronize OTN Services"
         self.synchronizing_otn_services_btn.click()
-        self.click_button(success_message, failure_message)
+        return self.click_button(success_message, failure_message)
 
     # ✅
     def click_deleting_ROADM_inconsistent_services(self) -> bool:
         success_message = "Inconsistent ROADM services deleted Successfully"
         failure_message = "Delete Inconsistent ROADM Services"
         self.deleting_roadm_inconsistent_services_btn.click()
-        self.click_button(success_message, failure_message)
+        return self.click_button(success_message, failure_message)
 
     # ✅
     def click_synchronizing_ROADM_services(self) -> bool:
         success_message = "ROADM services synchronization started Successfully"
         failure_message = "Synchronize ROADM Services"
         self.synchronizing_roadm_services_btn.click()
-        self.click_button(success_message, failure_message)
+        return self.click_button(success_message, failure_message)
 
     # ✅
     def click_exit(self) -> bool:
         try:
             # Make sure the System Operations window is open before exiting from it
-            temp_verification = self.page.locator('div.common-functions-container')
-            expect(temp_verification).to_be_visible(timeout=5000)
+            expect(self.system_operations_container).to_be_visible(timeout=5000)
 
             self.exit_btn.click()
             
             # Check if the System Operations content div disappears after exiting
-            expect(temp_verification).to_be_hidden(timeout=10000) 
+            expect(self.system_operations_container).to_be_hidden(timeout=10000) 
 
             return True
 
@@ -141,20 +153,14 @@ class SystemOperationsPage:
         Generic function to click a button and verify that the action succeeded.
         """
         try:
-            # Ensure the success message is visible and verification wrapper appear(HTML)
-            success_message = self.page.locator(f'text={success_message}')
-            expect(success_message).to_be_visible(timeout=5000)  
-            temp_verification = self.page.locator('div.cdk-global-overlay-wrapper')
-            expect(temp_verification).to_be_visible(timeout=5000)
-            
-            # Optionally, wait for the success message to disappear (if you want to ensure it disappears after some time)
-            expect(success_message).to_be_hidden(timeout=5000)
-            
-            # Check if the global overlay wrapper disappears after the message disappears
-            expect(temp_verification).to_be_hidden(timeout=10000) 
+            # Wait for the success message and the verification wrapper (HTML) together - one condition, polled every 100ms
+            self.page.wait_for_function(_TOAST_AND_OVERLAY_VISIBLE_JS, arg=success_message, polling=100, timeout=5000)
+
+            # Then wait for both of them to disappear (baseline budget: overlay gone within 10s)
+            self.page.wait_for_function(_TOAST_AND_OVERLAY_HIDDEN_JS, arg=success_message, polling=100, timeout=10000)
 
             return True
 
-        except AssertionError:
+        except (AssertionError, PlaywrightTimeoutError):
             print(f"{failure_message} failed ❌")
             return False
\ No newline at end of file
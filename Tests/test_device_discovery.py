@@ -71,6 +71,8 @@ def _pick_dropdown_best_effort(setter_fn, getter_fn, candidates: list[str]):
     return None, current, after
 
 
+# NOTE: this flow clicks "Save as Default" / "Reset to Default", which change server-wide discovery
+# defaults. Never run it concurrently with another Device Discovery run against the same server.
 def test_device_discovery(page, left_panel):
     dd = DeviceDiscovery(page)
 